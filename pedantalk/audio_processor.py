@@ -1,54 +1,357 @@
+import asyncio
+import contextlib
+import itertools
+import logging
 import os
 import random
+import shutil
 import subprocess
-import glob
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, cast
 
 import ffmpeg
+import openai
+from openai import AsyncOpenAI
 
 from pedantalk.config import Config
 from pedantalk.models import AudioSegment, Conversation, DialogueTurn, PodcastEpisode, Role, Speaker
+from pedantalk.openai_client import get_openai_client
+
+try:
+    import fcntl
+    HAVE_FILE_LOCKS = True
+except ImportError:  # Windows; scratch directories of dead runs are then left in place
+    HAVE_FILE_LOCKS = False
+
+logger = logging.getLogger(__name__)
+
+# Stream parameters of OpenAI TTS audio; silence is rendered to match so the concat demuxer can join the files
+TTS_SAMPLE_RATE = 24000
+TTS_CHANNEL_LAYOUT = "mono"
+TTS_SAMPLE_FORMAT = "s16"
+
+# A FLAC stream starts with the "fLaC" marker, a metadata block header and STREAMINFO
+FLAC_HEADER_SIZE = 42
+
+# Read size for streamed TTS responses
+TTS_CHUNK_SIZE = 64 * 1024
+
+# Silence durations are quantized to this step so a small set of files can be reused
+SILENCE_STEP_MS = 100
+
+# writev accepts at most IOV_MAX buffers per call (1024 on Linux and macOS)
+WRITEV_MAX_CHUNKS = 1024
+
+# Each run's scratch directory is named with this prefix and holds a lock file that the run
+# keeps locked while it is alive
+SCRATCH_PREFIX = "pedantalk_"
+SCRATCH_LOCK_NAME = ".lock"
+
+# A scratch directory without a lock file may belong to a run that has not taken the lock
+# yet, so it is only removed once it is older than this many seconds
+SCRATCH_LOCK_GRACE_S = 60
+
+# Above this many leftover files, unlinks are spread over a thread pool
+PARALLEL_CLEANUP_THRESHOLD = 256
+CLEANUP_WORKERS = 8
+
+
+def _is_temporary_audio_file(name: str) -> bool:
+    """
+    Check whether a file name belongs to the processor's temporary files.
+    
+    Args:
+        name: The file name (without directory).
+        
+    Returns:
+        bool: True for audio fragments and leftover concat lists.
+    """
+    return name.endswith(".flac") or (name.startswith("concat") and name.endswith(".txt"))
+
+
+def _remove_file(path: str) -> bool:
+    """
+    Remove a file, reporting but not raising errors.
+    
+    Args:
+        path: The file path.
+        
+    Returns:
+        bool: True if the file was removed.
+    """
+    try:
+        os.unlink(path)
+        return True
+    except OSError as e:
+        logger.error("Error removing file %s: %s", path, e)
+        return False
+
+
+def _lock_scratch_dir(path: str) -> Optional[int]:
+    """
+    Create and lock the lock file of a scratch directory.
+    
+    Args:
+        path: The scratch directory.
+        
+    Returns:
+        Optional[int]: File descriptor holding the lock, or None where file locks are unavailable.
+    """
+    if not HAVE_FILE_LOCKS:
+        return None
+    
+    fd = os.open(os.path.join(path, SCRATCH_LOCK_NAME), os.O_WRONLY | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def _remove_stale_scratch_dirs(parent: str) -> int:
+    """
+    Remove the scratch directories of runs that are no longer alive.
+    
+    A live run holds the lock on its directory's lock file, so only directories whose
+    lock can be taken (or that never got a lock file) are removed.
+    
+    Args:
+        parent: The directory containing the per-run scratch directories.
+        
+    Returns:
+        int: Number of directories removed.
+    """
+    if not HAVE_FILE_LOCKS:
+        return 0
+    
+    with os.scandir(parent) as entries:
+        candidates = [
+            entry.path for entry in entries
+            if entry.name.startswith(SCRATCH_PREFIX) and entry.is_dir(follow_symlinks=False)
+        ]
+    
+    removed_count = 0
+    for path in candidates:
+        try:
+            fd = os.open(os.path.join(path, SCRATCH_LOCK_NAME), os.O_RDONLY)
+        except FileNotFoundError:
+            try:
+                if time.time() - os.stat(path).st_mtime < SCRATCH_LOCK_GRACE_S:
+                    continue
+            except FileNotFoundError:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed_count += 1
+            continue
+        except OSError:
+            # Another user's directory
+            continue
+        
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            # Still in use by a live run
+            os.close(fd)
+            continue
+        
+        shutil.rmtree(path, ignore_errors=True)
+        os.close(fd)
+        removed_count += 1
+    
+    return removed_count
+
+
+def _flac_duration_ms(data: bytes) -> Optional[int]:
+    """
+    Read the duration of a FLAC stream from its STREAMINFO metadata block.
+    
+    Args:
+        data: The FLAC file contents (only the first FLAC_HEADER_SIZE bytes are needed).
+        
+    Returns:
+        Optional[int]: The duration in milliseconds, or None if the header does not record it.
+    """
+    # "fLaC" marker, 4-byte metadata block header, then the 34-byte STREAMINFO block
+    if len(data) < FLAC_HEADER_SIZE or data[:4] != b"fLaC" or data[4] & 0x7F != 0:
+        return None
+    
+    block = data[8:FLAC_HEADER_SIZE]
+    sample_rate = int.from_bytes(block[10:13], "big") >> 4
+    total_samples = ((block[13] & 0x0F) << 32) | int.from_bytes(block[14:18], "big")
+    
+    # Streamed encoders may leave the sample count as 0 (unknown)
+    if sample_rate == 0 or total_samples == 0:
+        return None
+    
+    return total_samples * 1000 // sample_rate
+
+
+def _probe_duration_ms(path: str) -> Optional[int]:
+    """
+    Read the duration of an audio file with ffprobe.
+    
+    Args:
+        path: The audio file path.
+        
+    Returns:
+        Optional[int]: The duration in milliseconds, or None if the file has no audio
+            stream or its duration cannot be read.
+    """
+    try:
+        probe = ffmpeg.probe(path, select_streams="a")
+    except ffmpeg.Error as e:
+        logger.warning("Could not probe %s: %s", path, e.stderr.decode(errors="replace") if e.stderr else e)
+        return None
+    
+    duration = probe.get("format", {}).get("duration")
+    if not probe.get("streams") or not duration:
+        return None
+    
+    return int(float(duration) * 1000)
+
+
+def _write_chunks(path: str, chunks: List[bytes]) -> None:
+    """
+    Write byte chunks to a file, using writev calls where the platform supports it.
+    
+    Args:
+        path: The output file path.
+        chunks: The data chunks, in order.
+    """
+    with open(path, "wb", buffering=0) as f:
+        fd = f.fileno()
+        for start in range(0, len(chunks), WRITEV_MAX_CHUNKS):
+            batch = chunks[start:start + WRITEV_MAX_CHUNKS]
+            written = os.writev(fd, batch) if hasattr(os, "writev") else 0
+            if written == sum(len(chunk) for chunk in batch):
+                continue
+            
+            # Both writev and write may be short, so write the rest until none is left
+            remainder = memoryview(b"".join(batch))[written:]
+            while remainder:
+                remainder = remainder[os.write(fd, remainder):]
+
+
+def _concat_entries(paths: List[str]) -> bytes:
+    """
+    Format lines of an ffmpeg concat list.
+    
+    Args:
+        paths: The audio file paths.
+        
+    Returns:
+        bytes: The encoded entries. Each path is an explicit file: URL, since the demuxer
+            resolves entries (absolute paths included) against the pipe URL of the list
+            and would otherwise read them from stdin.
+            
+    Raises:
+        ValueError: If a path contains a single quote, which the concat list cannot carry safely.
+    """
+    for path in paths:
+        if "'" in path:
+            raise ValueError(f"Audio file path cannot contain a single quote: {path}")
+    
+    return "".join([f"file 'file:{os.path.abspath(path)}'\n" for path in paths]).encode()
 
 
 class AudioProcessor:
     """Processor for generating and combining audio files for the podcast."""
     
-    def __init__(self, openai_client: Any) -> None:
+    def __init__(self, openai_client: Optional[AsyncOpenAI] = None) -> None:
         """
         Initialize the audio processor.
         
         Args:
-            openai_client: The OpenAI client object.
+            openai_client: The async OpenAI client object. If omitted, the shared client is used,
+                so TTS reuses the HTTP/2 connections opened for the text requests.
         """
+        if openai_client is None:
+            # The shared client leaves retries to its retrying wrapper; TTS calls it directly
+            openai_client = get_openai_client().client.with_options(max_retries=Config.MAX_RETRIES)
         self.client = openai_client
+        # Bounds the number of TTS requests in flight to stay under the provider's rate limits
+        self._tts_semaphore = asyncio.Semaphore(Config.TTS_CONCURRENCY)
+        
+        # Settings read on every turn are captured once rather than looked up on Config each time
+        self._silence_min_ms = Config.SILENCE_MIN_MS
+        self._silence_max_ms = Config.SILENCE_MAX_MS
+        self._voice_map: Dict[Role, str] = {Role.HOST: Config.HOST_VOICE, Role.GUEST: Config.guest_voice()}
+        
+        # Sequence for turn file names; unlike random suffixes it never collides between
+        # concurrent turns, and names sort in turn order
+        self._seq = itertools.count()
+        
         Config.ensure_directories()
         
         # Clean up audio directory at startup to avoid accumulation of temp files
         self._cleanup_audio_directory()
+        
+        # Private to this processor, so concurrent runs never touch each other's files
+        self._scratch_dir = tempfile.mkdtemp(prefix=SCRATCH_PREFIX, dir=Config.SCRATCH_DIR)
+        self._scratch_lock: Optional[int] = None
+        try:
+            self._scratch_lock = _lock_scratch_dir(self._scratch_dir)
+            
+            # Render every silence length once instead of running ffmpeg for each gap
+            self._silence_cache = self._build_silence_cache(self._silence_min_ms, self._silence_max_ms)
+        except BaseException:
+            self.close()
+            raise
+    
+    async def warm_up(self) -> None:
+        """
+        Issue a tiny TTS request so the connection is established before the first real turn.
+        
+        Failures are reported but not raised, since the real requests will retry the connection.
+        """
+        try:
+            await self.client.audio.speech.create(
+                model=Config.TTS_MODEL,
+                # Voices are validated against Config.AVAILABLE_VOICES; the SDK's voice Literal
+                # differs between versions
+                voice=cast(Any, self._voice_map[Role.HOST]),
+                input="a",
+                response_format="flac"
+            )
+        except openai.OpenAIError as e:
+            logger.warning("TTS warm-up request failed: %s", e)
+    
+    def close(self) -> None:
+        """Remove the scratch directory with the pre-rendered silences and any leftover turn files."""
+        shutil.rmtree(self._scratch_dir, ignore_errors=True)
+        if self._scratch_lock is not None:
+            os.close(self._scratch_lock)
+            self._scratch_lock = None
     
     def _cleanup_audio_directory(self) -> None:
         """
-        Clean up the audio directory by removing all temporary audio files.
+        Clean up the audio directory by removing all temporary audio files, and remove
+        the scratch directories of runs that are no longer alive.
         This helps prevent accumulation of files from previous runs,
         especially when they ended abnormally.
         """
-        print(f"Cleaning up audio directory: {Config.AUDIO_DIR}")
-        audio_files = glob.glob(os.path.join(Config.AUDIO_DIR, "*.flac"))
-        concat_files = glob.glob(os.path.join(Config.AUDIO_DIR, "concat*.txt"))
-        
-        # Count removed files for logging
-        removed_count = 0
-        
-        # Remove audio files
-        for file_path in audio_files + concat_files:
-            try:
-                os.remove(file_path)
-                removed_count += 1
-            except OSError as e:
-                print(f"Error removing file {file_path}: {e}")
+        logger.info("Cleaning up scratch directory: %s", Config.SCRATCH_DIR)
+        stale_count = _remove_stale_scratch_dirs(Config.SCRATCH_DIR)
+        if stale_count:
+            logger.info("Removed %d scratch directories of earlier runs", stale_count)
+        
+        logger.info("Cleaning up audio directory: %s", Config.AUDIO_DIR)
+        # Single directory pass; DirEntry already knows the name, so no extra stat calls
+        with os.scandir(Config.AUDIO_DIR) as entries:
+            file_paths = [entry.path for entry in entries if _is_temporary_audio_file(entry.name)]
+        
+        # Remove audio files; unlink blocks on I/O, so large backlogs are removed in parallel
+        if len(file_paths) > PARALLEL_CLEANUP_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+                removed_count = sum(executor.map(_remove_file, file_paths))
+        else:
+            removed_count = sum(_remove_file(file_path) for file_path in file_paths)
         
-        print(f"Removed {removed_count} temporary files from audio directory")
+        logger.info("Removed %d temporary audio files", removed_count)
     
     def _get_voice_for_role(self, role: Role) -> str:
         """
@@ -60,9 +363,9 @@ class AudioProcessor:
         Returns:
             str: The voice name.
         """
-        return Config.HOST_VOICE if role == Role.HOST else Config.GUEST_VOICE
+        return self._voice_map[role]
     
-    def _generate_audio_for_turn(self, turn: DialogueTurn, episode_id: str, conversation: Conversation) -> AudioSegment:
+    async def _generate_audio_for_turn(self, turn: DialogueTurn, episode_id: str, conversation: Conversation) -> AudioSegment:
         """
         Generate audio for a single conversation turn.
         
@@ -75,19 +378,16 @@ class AudioProcessor:
             AudioSegment: The generated audio segment.
         """
         voice = self._get_voice_for_role(turn.speaker)
-        filename = f"{episode_id}_{turn.speaker.value}_{random.randint(1000, 9999)}.flac"
-        output_path = os.path.join(Config.AUDIO_DIR, filename)
+        filename = f"{episode_id}_{turn.speaker.value}_{next(self._seq):06d}.flac"
+        output_path = os.path.join(self._scratch_dir, filename)
         
         # Get voice instruction if available
-        voice_instruction = None
-        if turn.speaker == Role.HOST and conversation.host.voice_instruction:
-            voice_instruction = conversation.host.voice_instruction
-        elif turn.speaker == Role.GUEST and conversation.guest.voice_instruction:
-            voice_instruction = conversation.guest.voice_instruction
+        speaker = conversation.host if turn.speaker is Role.HOST else conversation.guest
+        voice_instruction = speaker.voice_instruction or None
         
         # Create speech with OpenAI
-        speech_params = {
-            "model": "tts-1",
+        speech_params: Dict[str, Any] = {
+            "model": Config.TTS_MODEL,
             "voice": voice,
             "input": turn.text,
             "response_format": "flac"
@@ -95,28 +395,27 @@ class AudioProcessor:
         
         # Add voice instructions if available (note: it's "voice_instructions" with 's', not "voice_instruction")
         if voice_instruction:
-            print(f"Note: Using voice '{voice}' with instruction: {voice_instruction}")
+            logger.debug("Using voice '%s' with instruction: %s", voice, voice_instruction)
             speech_params["instructions"] = voice_instruction
         
-        response = self.client.audio.speech.create(**speech_params)
-        
-        # Save the audio file
-        response.stream_to_file(output_path)
-        
-        # Get duration using ffmpeg
-        probe = ffmpeg.probe(output_path)
-        
-        # Extract duration more robustly - handle different ffmpeg probe structures
-        duration_ms = 0
-        if "format" in probe and "duration" in probe["format"]:
-            # Standard location
-            duration_ms = int(float(probe["format"]["duration"]) * 1000)
-        elif "streams" in probe and len(probe["streams"]) > 0 and "duration" in probe["streams"][0]:
-            # Sometimes duration is in the first stream for FLAC files
-            duration_ms = int(float(probe["streams"][0]["duration"]) * 1000)
-        else:
+        # Receive the audio as it is synthesized instead of waiting for the whole response
+        chunks: List[bytes] = []
+        header = b""
+        async with self._tts_semaphore:
+            async with self.client.audio.speech.with_streaming_response.create(**speech_params) as response:
+                async for chunk in response.iter_bytes(chunk_size=TTS_CHUNK_SIZE):
+                    if len(header) < FLAC_HEADER_SIZE:
+                        header += chunk[:FLAC_HEADER_SIZE - len(header)]
+                    chunks.append(chunk)
+        
+        # Write the file from a worker thread so disk I/O never blocks the other turns' downloads
+        await asyncio.to_thread(_write_chunks, output_path, chunks)
+        
+        # Read the duration from the FLAC header instead of probing the file
+        duration_ms = _flac_duration_ms(header)
+        if duration_ms is None:
             # Fallback: Use a default duration if we can't determine it
-            print(f"Warning: Could not determine duration for {output_path}. Using 3 seconds as default.")
+            logger.warning("Could not determine duration for %s. Using 3 seconds as default.", output_path)
             duration_ms = 3000
         
         return AudioSegment(
@@ -126,196 +425,291 @@ class AudioProcessor:
             duration_ms=duration_ms
         )
     
-    def _generate_silence(self, min_ms: int, max_ms: int, episode_id: str) -> str:
+    def _build_silence_cache(self, min_ms: int, max_ms: int) -> Dict[int, str]:
         """
-        Generate a silent audio segment.
+        Render silent audio files for every quantized duration in a single ffmpeg run.
         
         Args:
             min_ms: Minimum silence duration in milliseconds.
             max_ms: Maximum silence duration in milliseconds.
-            episode_id: Unique identifier for the episode.
             
         Returns:
-            str: Path to the generated silence file.
+            Dict[int, str]: Mapping of duration in milliseconds to the silence file path.
         """
-        duration_ms = random.randint(min_ms, max_ms)
-        duration_s = duration_ms / 1000.0
-        filename = f"{episode_id}_silence_{random.randint(1000, 9999)}.flac"
-        output_path = os.path.join(Config.AUDIO_DIR, filename)
+        low = max(SILENCE_STEP_MS, round(min_ms / SILENCE_STEP_MS) * SILENCE_STEP_MS)
+        high = max(low, round(max_ms / SILENCE_STEP_MS) * SILENCE_STEP_MS)
+        cache = {
+            duration_ms: os.path.join(self._scratch_dir, f"silence_{duration_ms:04d}.flac")
+            for duration_ms in range(low, high + 1, SILENCE_STEP_MS)
+        }
         
-        # Create silence using ffmpeg
-        ffmpeg.input(f"anullsrc=r=44100:cl=stereo", t=duration_s, f="lavfi").output(
-            output_path, acodec="flac", ar="44100").overwrite_output().run(quiet=True)
+        # One lavfi source feeding one output per duration
+        source = ffmpeg.input(
+            f"anullsrc=r={TTS_SAMPLE_RATE}:cl={TTS_CHANNEL_LAYOUT}", t=high / 1000.0, f="lavfi"
+        )
+        outputs = [
+            source.output(
+                path,
+                t=duration_ms / 1000.0,
+                acodec="flac",
+                ar=str(TTS_SAMPLE_RATE),
+                sample_fmt=TTS_SAMPLE_FORMAT
+            )
+            for duration_ms, path in cache.items()
+        ]
+        ffmpeg.merge_outputs(*outputs).overwrite_output().run(quiet=True)
+        
+        return cache
+    
+    def _generate_silence(self, min_ms: int, max_ms: int) -> Tuple[str, int]:
+        """
+        Pick a silent audio segment of random length.
         
-        return output_path
+        Args:
+            min_ms: Minimum silence duration in milliseconds.
+            max_ms: Maximum silence duration in milliseconds.
+            
+        Returns:
+            Tuple[str, int]: Path to the pre-rendered silence file closest to the chosen
+                duration, and that file's duration in milliseconds.
+        """
+        duration_ms = random.randint(min_ms, max_ms)
+        bucket = min(self._silence_cache, key=lambda d: abs(d - duration_ms))
+        return self._silence_cache[bucket], bucket
     
-    def _create_concat_file(self, audio_files: List[str], concat_file_path: str) -> None:
+    def _concat_command(self, output_path: str) -> List[str]:
         """
-        Create a concat file for ffmpeg.
+        Build the ffmpeg command that joins the files of a concat list read from stdin.
+        
+        All inputs share the TTS stream parameters, so the concat demuxer can read them
+        as one stream without a filter graph. The frames are re-encoded rather than
+        copied: copied FLAC frames keep each input's frame numbers and the first input's
+        STREAMINFO, which leaves the output with a wrong length and broken seeking.
         
         Args:
-            audio_files: List of audio file paths.
-            concat_file_path: Path to save the concat file.
+            output_path: Output file path.
+            
+        Returns:
+            List[str]: The ffmpeg command line.
         """
-        with open(concat_file_path, 'w') as f:
-            for audio_file in audio_files:
-                f.write(f"file '{audio_file}'\n")
+        return [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-thread_queue_size", "1024",
+            "-f", "concat",
+            "-safe", "0",
+            "-protocol_whitelist", "pipe,file",
+            "-i", "pipe:0",
+            "-c:a", "flac",
+            "-y",
+            output_path
+        ]
     
-    def _combine_audio_files(self, audio_files: List[str], output_path: str) -> None:
+    def _combine_audio_files(self, audio_files: List[str], output_path: str, errors: List[str]) -> None:
         """
-        Combine multiple audio files using ffmpeg.
+        Combine audio files by re-encoding them through the concat filter.
+        
+        This is the fallback for inputs that turn out to be mismatched and cannot be
+        joined by the concat demuxer.
         
         Args:
             audio_files: List of audio file paths.
             output_path: Output file path.
+            errors: Errors from earlier attempts, included in the raised exception.
         """
-        # Verify all input files exist
-        for audio_file in audio_files:
-            if not os.path.exists(audio_file):
-                print(f"Warning: Audio file does not exist: {audio_file}")
+        # Verify all input files exist with one directory listing rather than a stat per file
+        existing: Set[str] = set()
+        for directory in {os.path.dirname(f) for f in audio_files}:
+            with os.scandir(directory or ".") as entries:
+                existing.update(os.path.join(directory, entry.name) for entry in entries)
         
         # Only proceed with files that exist
-        valid_audio_files = [f for f in audio_files if os.path.exists(f)]
+        valid_audio_files = [f for f in audio_files if f in existing]
+        missing_count = len(audio_files) - len(valid_audio_files)
+        if missing_count:
+            logger.warning("%d audio files do not exist and will be skipped", missing_count)
         
         if not valid_audio_files:
-            print("Error: No valid audio files to combine")
+            logger.error("No valid audio files to combine")
             return
-            
-        # Create concat file
-        concat_file = os.path.join(Config.AUDIO_DIR, "concat.txt")
-        self._create_concat_file(valid_audio_files, concat_file)
         
-        # Debug: show content of concat file
-        print(f"Debug: Contents of concat file ({concat_file}):")
-        with open(concat_file, 'r') as f:
-            print(f.read())
+        logger.info("Trying filter_complex approach...")
+        # Create filter_complex input string
+        inputs = []
+        filter_parts = []
         
-        # Try multiple methods to combine audio files
-        success = False
-        errors = []
+        for i, file in enumerate(valid_audio_files):
+            inputs.extend(["-i", file])
+            filter_parts.append(f"[{i}:0]")
         
-        # Method 1: Standard ffmpeg-python concat
-        try:
-            print(f"Method 1: Running ffmpeg-python to combine {len(valid_audio_files)} audio files...")
-            ffmpeg.input(concat_file, f="concat", safe=0).output(
-                output_path, acodec="flac", ar="44100").overwrite_output().run()
-            print(f"Success! Combined audio files to: {output_path}")
-            success = True
-        except ffmpeg._run.Error as e:
-            errors.append(f"Method 1 failed: {e}")
-            print(f"Method 1 failed: {e}")
-        
-        # Method 2: Direct subprocess call if method 1 failed
-        if not success:
-            try:
-                print("Method 2: Trying direct subprocess call...")
-                cmd = [
-                    "ffmpeg", 
-                    "-f", "concat", 
-                    "-safe", "0", 
-                    "-i", concat_file, 
-                    "-c:a", "flac", 
-                    "-ar", "44100", 
-                    "-y", 
-                    output_path
-                ]
-                process = subprocess.run(cmd, capture_output=True, text=True, check=False)
-                if process.returncode != 0:
-                    errors.append(f"Method 2 failed: {process.stderr}")
-                    print(f"Method 2 failed: {process.stderr}")
-                else:
-                    print("Method 2 succeeded!")
-                    success = True
-            except Exception as sub_e:
-                errors.append(f"Method 2 exception: {sub_e}")
-                print(f"Method 2 exception: {sub_e}")
-        
-        # Method 3: Use filtercomplex for concat if previous methods failed
-        if not success:
-            try:
-                print("Method 3: Trying filter_complex approach...")
-                # Create filter_complex input string
-                inputs = []
-                filter_parts = []
-                
-                for i, file in enumerate(valid_audio_files):
-                    inputs.extend(["-i", file])
-                    filter_parts.append(f"[{i}:0]")
-                
-                filter_complex = f"{' '.join(filter_parts)}concat=n={len(valid_audio_files)}:v=0:a=1[out]"
-                
-                cmd = [
-                    "ffmpeg",
-                    *inputs,
-                    "-filter_complex", filter_complex,
-                    "-map", "[out]",
-                    "-y", output_path
-                ]
-                
-                print(f"Running command: {' '.join(cmd)}")
-                process = subprocess.run(cmd, capture_output=True, text=True, check=False)
-                
-                if process.returncode != 0:
-                    errors.append(f"Method 3 failed: {process.stderr}")
-                    print(f"Method 3 failed: {process.stderr}")
-                else:
-                    print("Method 3 succeeded!")
-                    success = True
-            except Exception as e:
-                errors.append(f"Method 3 exception: {e}")
-                print(f"Method 3 exception: {e}")
-        
-        # Clean up
-        if os.path.exists(concat_file):
-            os.remove(concat_file)
-            
-        # Raise exception if all methods failed
-        if not success:
+        filter_complex = f"{' '.join(filter_parts)}concat=n={len(valid_audio_files)}:v=0:a=1[out]"
+        
+        cmd = [
+            "ffmpeg",
+            *inputs,
+            "-filter_complex", filter_complex,
+            "-map", "[out]",
+            "-y", output_path
+        ]
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running command: %s", " ".join(cmd))
+        process = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        
+        if process.returncode != 0:
+            errors.append(f"filter_complex failed: {process.stderr}")
             raise RuntimeError(f"Failed to combine audio files. Errors: {errors}")
+        
+        logger.info("filter_complex succeeded")
     
-    def generate_podcast_audio(self, conversation: Conversation, episode_id: str) -> PodcastEpisode:
+    async def _schedule_turns(
+        self, 
+        conversation: Conversation, 
+        episode_id: str, 
+        turn_queue: Optional["asyncio.Queue[Optional[DialogueTurn]]"], 
+        tasks: List["asyncio.Task[AudioSegment]"], 
+        task_queue: "asyncio.Queue[Optional[asyncio.Task[AudioSegment]]]", 
+        on_turn: Optional[Callable[[DialogueTurn], None]] = None
+    ) -> None:
+        """
+        Start TTS for each turn as soon as it is available.
+        
+        Args:
+            conversation: The podcast conversation.
+            episode_id: Unique identifier for the episode.
+            turn_queue: Queue of turns still being generated, terminated by None, or
+                None to use the turns already in the conversation.
+            tasks: List that receives every task started.
+            task_queue: Queue that receives the tasks in turn order, terminated by None.
+            on_turn: Optional callback invoked with each turn once its TTS has started.
+        """
+        def schedule(turn: DialogueTurn) -> None:
+            task = asyncio.create_task(self._generate_audio_for_turn(turn, episode_id, conversation))
+            tasks.append(task)
+            task_queue.put_nowait(task)
+            if on_turn is not None:
+                on_turn(turn)
+        
+        try:
+            if turn_queue is None:
+                for turn in conversation.turns:
+                    schedule(turn)
+            else:
+                while (queued_turn := await turn_queue.get()) is not None:
+                    schedule(queued_turn)
+        finally:
+            task_queue.put_nowait(None)
+    
+    async def generate_podcast_audio(
+        self, 
+        conversation: Conversation, 
+        episode_id: str, 
+        turn_queue: Optional["asyncio.Queue[Optional[DialogueTurn]]"] = None, 
+        on_turn: Optional[Callable[[DialogueTurn], None]] = None
+    ) -> PodcastEpisode:
         """
         Generate audio for an entire podcast episode.
         
         Args:
             conversation: The podcast conversation.
             episode_id: Unique identifier for the episode.
+            turn_queue: Optional queue of turns that are still being generated, terminated
+                by None. TTS starts on each turn as it arrives instead of waiting for the
+                whole conversation. If the producer fails, this coroutine must be cancelled.
+            on_turn: Optional callback invoked with each turn as it is scheduled, so other
+                consumers such as the transcript writer share the single pass over the turns.
             
         Returns:
             PodcastEpisode: The complete podcast episode with audio.
         """
-        # Create episode
-        episode = PodcastEpisode(
-            topic=conversation.topic,
-            host=conversation.host,
-            guest=conversation.guest,
-            conversation=conversation.turns
+        final_output_path = os.path.join(Config.OUTPUT_DIR, f"{episode_id}_final.flac")
+        
+        # Generate audio for all turns concurrently, starting each one as soon as its turn is known
+        tasks: List["asyncio.Task[AudioSegment]"] = []
+        task_queue: "asyncio.Queue[Optional[asyncio.Task[AudioSegment]]]" = asyncio.Queue()
+        scheduler = asyncio.create_task(
+            self._schedule_turns(conversation, episode_id, turn_queue, tasks, task_queue, on_turn)
+        )
+        
+        # Start the muxer right away and hand it each file once every earlier turn is ready,
+        # so ffmpeg start-up overlaps with synthesis instead of following it
+        mux = await asyncio.create_subprocess_exec(
+            *self._concat_command(final_output_path),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
         )
         
-        # Generate audio for each turn
         audio_segments: List[AudioSegment] = []
         all_audio_files: List[str] = []
-        
-        for turn in conversation.turns:
-            # Add a silence before each turn (except the first)
-            if all_audio_files:
-                silence_file = self._generate_silence(
-                    Config.SILENCE_MIN_MS, 
-                    Config.SILENCE_MAX_MS, 
-                    episode_id
-                )
-                all_audio_files.append(silence_file)
+        total_ms = 0
+        try:
+            if mux.stdin is None:
+                raise RuntimeError("ffmpeg stdin is not available")
             
-            # Generate audio for the turn
-            audio_segment = self._generate_audio_for_turn(turn, episode_id, conversation)
-            audio_segments.append(audio_segment)
-            all_audio_files.append(audio_segment.audio_path)
-        
-        # Combine all audio files
-        final_output_path = os.path.join(Config.OUTPUT_DIR, f"{episode_id}_final.flac")
-        self._combine_audio_files(all_audio_files, final_output_path)
+            logger.info("Combining audio files as turns complete...")
+            while (task := await task_queue.get()) is not None:
+                audio_segment = await task
+                
+                # Add a silence before each turn (except the first); the gap and the turn
+                # go to the muxer together so each turn costs a single write
+                new_files: List[str] = []
+                if all_audio_files:
+                    silence_file, gap_ms = self._generate_silence(
+                        self._silence_min_ms, 
+                        self._silence_max_ms
+                    )
+                    new_files.append(silence_file)
+                    total_ms += gap_ms
+                new_files.append(audio_segment.audio_path)
+                
+                audio_segments.append(audio_segment)
+                total_ms += audio_segment.duration_ms
+                all_audio_files.extend(new_files)
+                mux.stdin.write(_concat_entries(new_files))
+                await mux.stdin.drain()
+            
+            await scheduler
+            mux.stdin.close()
+            _, stderr = await mux.communicate()
+        except BaseException:
+            scheduler.cancel()
+            for task in tasks:
+                task.cancel()
+            if mux.returncode is None:
+                mux.kill()
+                await mux.wait()
+            # Never leave a truncated episode at the final path
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(final_output_path)
+            raise
+        
+        logger.debug("Concat list (%d entries): %s", len(all_audio_files), all_audio_files[:5])
         
-        # Update and return the episode
+        try:
+            # A zero exit status does not guarantee a usable file, so check the output itself
+            probed_ms = await asyncio.to_thread(_probe_duration_ms, final_output_path) if mux.returncode == 0 else None
+            if probed_ms is not None:
+                logger.info("Combined audio files to: %s", final_output_path)
+            else:
+                errors = [f"Concat demuxer failed: {stderr.decode(errors='replace') or 'output has no readable audio stream'}"]
+                logger.warning("%s", errors[0])
+                # Inputs are mismatched; fall back to decoding and re-encoding everything
+                await asyncio.to_thread(self._combine_audio_files, all_audio_files, final_output_path, errors)
+                probed_ms = await asyncio.to_thread(_probe_duration_ms, final_output_path)
+        finally:
+            # Turn files are only needed for the final mux; the silences are kept for later episodes
+            for audio_segment in audio_segments:
+                _remove_file(audio_segment.audio_path)
+        
+        # Create the episode now that every turn is known
+        episode = PodcastEpisode(
+            topic=conversation.topic,
+            host=conversation.host,
+            guest=conversation.guest,
+            conversation=conversation.turns
+        )
         episode.audio_segments = audio_segments
         episode.final_audio_path = final_output_path
         episode.metadata = {
@@ -323,7 +717,8 @@ class AudioProcessor:
             "topic": conversation.topic.title,
             "host": conversation.host.name,
             "guest": conversation.guest.name,
-            "duration": str(sum(segment.duration_ms for segment in audio_segments) / 1000.0)
+            # Length of the final audio file; the sum of the turns and gaps if it cannot be read
+            "duration": str((probed_ms if probed_ms is not None else total_ms) / 1000.0)
         }
         
-        return episode 
+        return episode
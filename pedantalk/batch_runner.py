@@ -0,0 +1,106 @@
+import asyncio
+import datetime
+import json
+import logging
+import os
+from typing import Any, Dict, Final, Optional
+
+import orjson
+from openai import AsyncOpenAI
+
+from pedantalk.config import Config
+from pedantalk.openai_client import TRANSIENT_ERRORS, get_openai_client
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT: Final = "/v1/chat/completions"
+
+# Terminal states of a batch job
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchRunner:
+    """Runner for chat completion requests through the OpenAI Batch API."""
+
+    def __init__(self, client: Optional[AsyncOpenAI] = None) -> None:
+        """
+        Initialize the batch runner.
+        
+        Args:
+            client: Optional OpenAI client; the shared client is used by default.
+        """
+        if client is None:
+            # The shared client leaves retries to its retrying wrapper, which batch calls bypass
+            client = get_openai_client().client.with_options(max_retries=Config.MAX_RETRIES)
+        self.client = client
+    
+    def write_batch_file(self, requests: Dict[str, Dict[str, Any]], name: str = "batch") -> str:
+        """
+        Write requests to a JSONL batch input file.
+        
+        Args:
+            requests: Chat completion arguments by custom ID.
+            name: Prefix of the file name.
+        
+        Returns:
+            str: Path of the batch input file.
+        """
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(Config.BATCH_DIR, f"{name}_{timestamp}.jsonl")
+        
+        with open(path, "w", encoding="utf-8") as f:
+            for custom_id, body in requests.items():
+                line = {"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body}
+                f.write(json.dumps(line) + "\n")
+        
+        return path
+    
+    async def run(self, requests: Dict[str, Dict[str, Any]], name: str = "batch") -> Dict[str, Optional[str]]:
+        """
+        Submit requests as one batch and wait for the results.
+        
+        Args:
+            requests: Chat completion arguments by custom ID.
+            name: Prefix of the batch input file name.
+        
+        Returns:
+            Dict[str, Optional[str]]: Completion content by custom ID; None for requests that failed.
+        """
+        path = self.write_batch_file(requests, name)
+        with open(path, "rb") as f:
+            input_file = await self.client.files.create(file=f, purpose="batch")
+        
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h"
+        )
+        logger.info("Submitted batch %s with %d requests from %s", batch.id, len(requests), path)
+        
+        while batch.status not in BATCH_FINAL_STATUSES:
+            await asyncio.sleep(Config.BATCH_POLL_INTERVAL)
+            try:
+                batch = await self.client.batches.retrieve(batch.id)
+            except TRANSIENT_ERRORS as e:
+                # The batch keeps running server-side; one failed poll must not abandon it
+                logger.warning("Could not poll batch %s, retrying in %d s: %s", batch.id, Config.BATCH_POLL_INTERVAL, e)
+                continue
+            logger.info("Batch %s status: %s", batch.id, batch.status)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+        
+        output = await self.client.files.content(batch.output_file_id)
+        
+        results: Dict[str, Optional[str]] = {custom_id: None for custom_id in requests}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.warning("Batch request %s failed: %s", record.get("custom_id"), record.get("error"))
+                continue
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        
+        return results
@@ -1,6 +1,8 @@
+import functools
 import os
 import random
-from typing import Dict, List, Optional
+import tempfile
+from typing import Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -14,6 +16,8 @@ class Config:
 
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     MODEL_NAME: str = os.getenv("MODEL_NAME", "gpt-4o")
+    # Chat models that predate structured outputs (json_schema response formats)
+    UNSTRUCTURED_MODEL_PREFIXES: Tuple[str, ...] = ("gpt-3.5", "gpt-4-")
     
     # Available voices
     AVAILABLE_VOICES: List[str] = [
@@ -25,32 +29,62 @@ class Config:
     HOST_VOICE: str = os.getenv("HOST_VOICE", "nova")
     HOST_VOICE_INSTRUCTION: str = os.getenv("HOST_VOICE_INSTRUCTION", "")
     
-    # Guest voice - will be determined at runtime
-    @staticmethod
-    def _select_random_guest_voice() -> str:
-        """Select a random guest voice different from the host voice."""
-        default_host = "echo"
-        host_voice = os.getenv("HOST_VOICE", default_host)
-        guest_voice_env = os.getenv("GUEST_VOICE")
-        
-        if guest_voice_env:
-            return guest_voice_env
-        
-        available_voices = ["alloy", "ash", "ballad", "coral", "echo", 
-                            "fable", "onyx", "nova", "sage", "shimmer"]
-        available = [v for v in available_voices if v != host_voice]
-        return random.choice(available)
-    
-    GUEST_VOICE: str = _select_random_guest_voice()
-    
     # Audio settings
     SILENCE_MIN_MS: int = int(os.getenv("SILENCE_MIN_MS", "500"))
     SILENCE_MAX_MS: int = int(os.getenv("SILENCE_MAX_MS", "1500"))
     
+    # TTS model; voice instructions are only honored by gpt-4o-mini-tts
+    TTS_MODEL: str = os.getenv("TTS_MODEL", "tts-1")
+    
+    # Maximum number of TTS requests in flight at once
+    TTS_CONCURRENCY: int = int(os.getenv("TTS_CONCURRENCY", "8"))
+    
+    # Chat and embedding requests in flight at once, and retries after a transient error
+    MAX_CONCURRENT_REQUESTS: int = int(os.getenv("MAX_CONCURRENT_REQUESTS", "4"))
+    MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "5"))
+    
     # Output directories
     OUTPUT_DIR: str = os.getenv("OUTPUT_DIR", "output")
     AUDIO_DIR: str = os.path.join(OUTPUT_DIR, "audio")
     TRANSCRIPT_DIR: str = os.path.join(OUTPUT_DIR, "transcripts")
+    BATCH_DIR: str = os.path.join(OUTPUT_DIR, "batches")
+    
+    # Seconds between status checks of a submitted batch
+    BATCH_POLL_INTERVAL: int = int(os.getenv("BATCH_POLL_INTERVAL", "60"))
+    
+    # Response cache for guest persona and voice instruction completions, which are only
+    # separate requests in --legacy mode; set LLM_CACHE_PATH to an empty string to disable it
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", os.path.join(OUTPUT_DIR, "llm_cache.sqlite3"))
+    
+    # Reuse the voice instruction of a similar guest persona, matched by embedding similarity
+    # (--legacy mode only)
+    SEMANTIC_CACHE: bool = os.getenv("SEMANTIC_CACHE", "false").lower() in ("1", "true", "yes")
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+    EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+    
+    # Parent of each run's private scratch directory for intermediate audio; tmpfs keeps
+    # these writes in memory
+    SCRATCH_DIR: str = os.getenv("SCRATCH_DIR") or (
+        "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    )
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def guest_voice(cls) -> str:
+        """
+        Get the guest voice, selecting it on first use.
+        
+        The selection is deferred so CLI overrides of the host voice are applied first,
+        and cached so every caller sees the same voice.
+        
+        Returns:
+            str: GUEST_VOICE from the environment, or a random voice different from the host voice.
+        """
+        guest_voice_env = os.getenv("GUEST_VOICE")
+        if guest_voice_env:
+            return guest_voice_env
+        
+        return random.choice([v for v in cls.AVAILABLE_VOICES if v != cls.HOST_VOICE])
     
     @classmethod
     def validate(cls) -> Optional[str]:
@@ -63,9 +97,27 @@ class Config:
         if not cls.OPENAI_API_KEY:
             return "OPENAI_API_KEY is required but not set"
         
+        if cls.MODEL_NAME == "gpt-4" or cls.MODEL_NAME.startswith(cls.UNSTRUCTURED_MODEL_PREFIXES):
+            return f"MODEL_NAME {cls.MODEL_NAME} does not support structured outputs; use gpt-4o or gpt-4o-mini"
+        
         if cls.SILENCE_MIN_MS >= cls.SILENCE_MAX_MS:
             return "SILENCE_MIN_MS must be less than SILENCE_MAX_MS"
         
+        if cls.TTS_CONCURRENCY < 1:
+            return "TTS_CONCURRENCY must be at least 1"
+        
+        if cls.MAX_CONCURRENT_REQUESTS < 1:
+            return "MAX_CONCURRENT_REQUESTS must be at least 1"
+        
+        if cls.BATCH_POLL_INTERVAL < 1:
+            return "BATCH_POLL_INTERVAL must be at least 1"
+        
+        if cls.MAX_RETRIES < 0:
+            return "MAX_RETRIES must not be negative"
+        
+        if not 0.0 < cls.SEMANTIC_CACHE_THRESHOLD <= 1.0:
+            return "SEMANTIC_CACHE_THRESHOLD must be greater than 0 and at most 1"
+        
         if cls.HOST_VOICE not in cls.AVAILABLE_VOICES:
             return f"HOST_VOICE must be one of {', '.join(cls.AVAILABLE_VOICES)}"
         
@@ -77,6 +129,8 @@ class Config:
         os.makedirs(cls.OUTPUT_DIR, exist_ok=True)
         os.makedirs(cls.AUDIO_DIR, exist_ok=True)
         os.makedirs(cls.TRANSCRIPT_DIR, exist_ok=True)
+        os.makedirs(cls.BATCH_DIR, exist_ok=True)
+        os.makedirs(cls.SCRATCH_DIR, exist_ok=True)
     
     @classmethod
     def to_dict(cls) -> Dict[str, str]:
@@ -90,7 +144,13 @@ class Config:
             "MODEL_NAME": cls.MODEL_NAME,
             "HOST_VOICE": cls.HOST_VOICE,
             "HOST_VOICE_INSTRUCTION": cls.HOST_VOICE_INSTRUCTION,
-            "GUEST_VOICE": cls.GUEST_VOICE,
+            "GUEST_VOICE": cls.guest_voice(),
             "SILENCE_MIN_MS": str(cls.SILENCE_MIN_MS),
             "SILENCE_MAX_MS": str(cls.SILENCE_MAX_MS),
+            "TTS_MODEL": cls.TTS_MODEL,
+            "TTS_CONCURRENCY": str(cls.TTS_CONCURRENCY),
+            "MAX_CONCURRENT_REQUESTS": str(cls.MAX_CONCURRENT_REQUESTS),
+            "MAX_RETRIES": str(cls.MAX_RETRIES),
+            "LLM_CACHE_PATH": cls.LLM_CACHE_PATH,
+            "SEMANTIC_CACHE": str(cls.SEMANTIC_CACHE),
         } 
@@ -1,19 +1,233 @@
-from typing import Any, Dict, List, Optional
-import json
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Type, Union
+import asyncio
+import logging
 import random
 
-from openai import OpenAI
+import orjson
+from openai.types.chat import ChatCompletion
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from pedantalk.config import Config
-from pedantalk.models import Conversation, DialogueTurn, Role, Speaker, Topic
+from pedantalk.llm_cache import cache_key, get_llm_cache
+from pedantalk.models import Conversation, DialogueTurn, EpisodeResponse, GuestPersona, Role, Speaker, Topic, TurnsResponse
+from pedantalk.openai_client import get_openai_client
+
+logger = logging.getLogger(__name__)
+
+
+def _json_schema_format(name: str, model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build a strict structured-output response format from a model.
+    
+    Args:
+        name: Name of the schema.
+        model: The model describing the response.
+        
+    Returns:
+        Dict[str, Any]: The response_format argument for chat.completions.create.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "schema": model.model_json_schema(), "strict": True}
+    }
+
+
+# The response shapes are enforced by the API, so turns can be validated directly
+TURNS_RESPONSE_FORMAT = _json_schema_format("turns", TurnsResponse)
+EPISODE_RESPONSE_FORMAT = _json_schema_format("episode", EpisodeResponse)
+
+# Validates streamed turn objects into DialogueTurn dataclasses
+_TURN_ADAPTER: TypeAdapter[DialogueTurn] = TypeAdapter(DialogueTurn)
+
+# Filler exchange used when the model returns too few turns
+_FALLBACK_HOST_TMPL = (
+    "One important aspect of {title} that we haven't discussed yet is the broader implications. "
+    "Could you elaborate on how this affects society at large?"
+)
+_FALLBACK_GUEST_TMPL = (
+    "That's an excellent question. When we consider {title}, we have to recognize that it impacts multiple "
+    "domains of human experience. Research has shown several key patterns. First, there's the immediate effect "
+    "on individuals and communities. Second, we see longer-term structural changes that reshape institutions. "
+    "Finally, there are ethical considerations that we must address carefully."
+)
+
+
+# Prompts. System prompts are fully static so every request shares the same leading
+# message, which lets provider-side prompt caching reuse it; per-call values are
+# interpolated into the user templates only.
+_VOICE_SYSTEM_PROMPT = "You are a voice direction expert for audiobooks and podcasts."
+_VOICE_USER_TEMPLATE = (
+    "Based on the following personality and background, create a voice instruction for a text-to-speech "
+    "system that would best convey this person's speaking style. This should be a concise instruction "
+    "describing how the voice should sound, such as tone, pace, emotion, accent, etc. "
+    "Keep it under 100 characters.\n\n"
+    "Personality: {personality}\n"
+    "Background: {background}"
+)
+
+_GUEST_SYSTEM_PROMPT = "You are an expert at creating realistic podcast guest personas."
+_GUEST_USER_TEMPLATE = (
+    "Generate a JSON response with the following structure:\n"
+    "{{\n"
+    "  \"name\": \"Full Name\",\n"
+    "  \"personality\": \"Brief personality description\",\n"
+    "  \"background\": \"Professional background and expertise relevant to the topic\"\n"
+    "}}\n\n"
+    "Create an expert guest for a podcast on the topic: '{title}'\n\n"
+    "The topic is about: {description}"
+)
+
+_CONVERSATION_GUIDELINES = (
+    "Generate a natural, engaging, and SUBSTANTIVE conversation with real content, not just an introduction and conclusion. "
+    "The host should ask thoughtful questions, and the guest should provide detailed expert insights. "
+    "The conversation must be intellectually stimulating and have significant depth and substance. "
+    "DO NOT generate generic or superficial content. Include specific details, examples, and nuanced perspectives. "
+    "DO NOT include any wrap-up or conclusion - I will add those separately.\n\n"
+    "The conversation MUST alternate between host and guest, starting with the host.\n\n"
+    "Essential requirements:\n"
+    "1. A brief welcoming introduction from the host (first turn only)\n"
+    "2. Substantive exchanges with real intellectual content\n"
+    "3. Specific questions that explore different aspects of the topic in depth\n"
+    "4. Detailed, informative responses from the guest with examples and nuance\n"
+    "5. The conversation must progress logically with follow-up questions\n\n"
+    "Each turn has a 'speaker' (either 'host' or 'guest') and its 'text'."
+)
+
+_TURNS_SYSTEM_PROMPT = (
+    "You are generating a podcast conversation between a host and a guest expert.\n\n"
+    + _CONVERSATION_GUIDELINES
+)
+_TURNS_USER_TEMPLATE = (
+    "Host: {host_name}\n"
+    "Host personality: {host_personality}\n"
+    "Host background: {host_background}\n\n"
+    "Guest: {guest_name}\n"
+    "Guest personality: {guest_personality}\n"
+    "Guest background: {guest_background}\n\n"
+    "Create a substantive intellectual podcast conversation on '{title}' with EXACTLY {turns} turns, "
+    "including at least {exchanges} substantive exchanges.\n"
+    "IMPORTANT: After the introduction, you must generate {more_turns} MORE turns with substantial content.\n\n"
+    "DO NOT include any conclusion or wrap-up turns - those will be added separately.\n"
+    "ENSURE exactly {turns} turns total."
+)
+
+_EPISODE_SYSTEM_PROMPT = (
+    "You are generating a podcast episode between a host and a guest expert.\n\n"
+    "First create a realistic expert guest for the topic: their full name, a brief personality description, "
+    "their professional background and expertise relevant to the topic, and a concise voice_instruction for a "
+    "text-to-speech system describing how their voice should sound (tone, pace, emotion, accent, etc., "
+    "under 100 characters). Then generate the conversation between the host and the guest.\n\n"
+    + _CONVERSATION_GUIDELINES
+)
+_EPISODE_USER_TEMPLATE = (
+    "Topic: '{title}'\n"
+    "The topic is about: {description}\n\n"
+    "Host: {host_name}\n"
+    "Host personality: {host_personality}\n"
+    "Host background: {host_background}\n\n"
+    "Create the guest and a substantive intellectual podcast conversation on '{title}' with EXACTLY {turns} turns, "
+    "including at least {exchanges} substantive exchanges.\n"
+    "IMPORTANT: After the introduction, you must generate {more_turns} MORE turns with substantial content.\n\n"
+    "DO NOT include any conclusion or wrap-up turns - those will be added separately.\n"
+    "ENSURE exactly {turns} turns total."
+)
+
+
+class _TurnStreamParser:
+    """Incrementally extract the turn (and guest) objects from a streamed JSON document."""
+    
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        self.text = ""
+        self._pos = 0
+        self._stack: List[Tuple[str, int]] = []
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, data: str) -> List[Dict[str, Any]]:
+        """
+        Consume the next piece of the document.
+        
+        Args:
+            data: The text received since the previous call.
+            
+        Returns:
+            List[Dict[str, Any]]: Objects that are elements of an array or members of
+                the top-level object and were completed by this piece, in document order.
+        """
+        self.text += data
+        completed: List[Dict[str, Any]] = []
+        
+        text = self.text
+        for pos in range(self._pos, len(text)):
+            char = text[pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._stack.append((char, pos))
+            elif char in "]}" and self._stack:
+                opener, start = self._stack.pop()
+                if opener == "{" and self._stack and (self._stack[-1][0] == "[" or len(self._stack) == 1):
+                    try:
+                        value = orjson.loads(text[start:pos + 1])
+                    except orjson.JSONDecodeError:
+                        continue
+                    if isinstance(value, dict):
+                        completed.append(value)
+        
+        self._pos = len(text)
+        return completed
 
 
 class ConversationGenerator:
     """Generator for podcast conversations using OpenAI."""
     
-    def __init__(self) -> None:
-        """Initialize the conversation generator with OpenAI client."""
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+    def __init__(self, legacy: bool = False) -> None:
+        """
+        Initialize the conversation generator with OpenAI client.
+        
+        Args:
+            legacy: Generate the guest persona, voice instruction and turns with separate
+                requests instead of a single one.
+        """
+        self.client = get_openai_client()
+        self.legacy = legacy
+        # Only the separate guest persona and voice instruction requests are cached, so
+        # the database is not opened for the single-request path
+        self.cache = get_llm_cache() if legacy else None
+    
+    async def _cached_completion(self, messages: List[Dict[str, str]], **kwargs: Any) -> Optional[str]:
+        """
+        Run a chat completion, reusing the cached content of an identical request.
+        
+        Args:
+            messages: The request messages.
+            **kwargs: Additional arguments for chat.completions.create.
+            
+        Returns:
+            Optional[str]: The completion content.
+        """
+        async def create() -> Optional[str]:
+            # kwargs never carry stream=True, so this is a complete response
+            response: ChatCompletion = await self.client.create(
+                model=Config.MODEL_NAME,
+                messages=messages,
+                **kwargs
+            )
+            return response.choices[0].message.content
+        
+        if self.cache is None:
+            return await create()
+        
+        key = cache_key(Config.MODEL_NAME, messages, kwargs)
+        return await self.cache.get_or_set(key, create)
     
     def _generate_host(self, topic: Topic) -> Speaker:
         """
@@ -34,7 +248,7 @@ class ConversationGenerator:
             voice_instruction=Config.HOST_VOICE_INSTRUCTION if Config.HOST_VOICE_INSTRUCTION else None
         )
     
-    def _generate_guest_voice_instruction(self, personality: str, background: str) -> str:
+    async def _generate_guest_voice_instruction(self, personality: str, background: str) -> str:
         """
         Generate a voice instruction for the guest based on their personality and background.
         
@@ -45,28 +259,32 @@ class ConversationGenerator:
         Returns:
             str: A voice instruction for the guest.
         """
-        prompt = (
-            f"Based on the following personality and background, create a voice instruction for a text-to-speech "
-            f"system that would best convey this person's speaking style:\n\n"
-            f"Personality: {personality}\n"
-            f"Background: {background}\n\n"
-            f"This should be a concise instruction describing how the voice should sound, such as tone, pace, "
-            f"emotion, accent, etc. Keep it under 100 characters."
-        )
+        messages = [
+            {"role": "system", "content": _VOICE_SYSTEM_PROMPT},
+            {"role": "user", "content": _VOICE_USER_TEMPLATE.format(personality=personality, background=background)}
+        ]
         
-        response = self.client.chat.completions.create(
-            model=Config.MODEL_NAME,
-            messages=[
-                {"role": "system", "content": "You are a voice direction expert for audiobooks and podcasts."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=100
-        )
+        if self.cache is not None and Config.SEMANTIC_CACHE:
+            key = cache_key(Config.MODEL_NAME, messages, {"max_tokens": 100})
+            content = self.cache.get(key)
+            if content is None:
+                # Near-identical personas get the same direction, so reuse the closest match
+                embedding = await self.client.create_embedding(
+                    model=Config.EMBEDDING_MODEL,
+                    input=f"{personality}\n{background}"
+                )
+                vector = embedding.data[0].embedding
+                content = self.cache.find_similar("voice_instruction", vector, Config.SEMANTIC_CACHE_THRESHOLD)
+                if content is None:
+                    content = await self._cached_completion(messages, max_tokens=100)
+                    if content:
+                        self.cache.add_similar("voice_instruction", vector, content)
+        else:
+            content = await self._cached_completion(messages, max_tokens=100)
         
-        content = response.choices[0].message.content
         return content.strip() if content else "Speak with authority and clarity."
     
-    def _generate_guest(self, topic: Topic) -> Speaker:
+    async def _generate_guest(self, topic: Topic) -> Speaker:
         """
         Generate the guest expert based on the topic.
         
@@ -74,253 +292,468 @@ class ConversationGenerator:
             topic: The podcast topic.
             
         Returns:
-            Speaker: The guest speaker object.
-        """
-        prompt = (
-            f"Create an expert guest for a podcast on the topic: '{topic.title}'\n\n"
-            f"The topic is about: {topic.description}\n\n"
-            "Generate a JSON response with the following structure:\n"
-            "{\n"
-            "  \"name\": \"Full Name\",\n"
-            "  \"personality\": \"Brief personality description\",\n"
-            "  \"background\": \"Professional background and expertise relevant to the topic\"\n"
-            "}"
-        )
-        
-        response = self.client.chat.completions.create(
-            model=Config.MODEL_NAME,
-            messages=[
-                {"role": "system", "content": "You are an expert at creating realistic podcast guest personas."},
-                {"role": "user", "content": prompt}
+            Speaker: The guest speaker object. A generated guest has no voice instruction yet,
+                so it can be generated alongside the conversation.
+        """
+        content = await self._cached_completion(
+            [
+                {"role": "system", "content": _GUEST_SYSTEM_PROMPT},
+                {"role": "user", "content": _GUEST_USER_TEMPLATE.format(title=topic.title, description=topic.description)}
             ],
             response_format={"type": "json_object"}
         )
         
-        content = response.choices[0].message.content
         if content:
             try:
-                guest_data: Dict[str, str] = json.loads(content)
-                personality = guest_data["personality"]
-                background = guest_data["background"]
-                voice_instruction = self._generate_guest_voice_instruction(personality, background)
+                guest_data: Dict[str, str] = orjson.loads(content)
                 
                 return Speaker(
                     role=Role.GUEST,
-                    voice=Config.GUEST_VOICE,
+                    voice=Config.guest_voice(),
                     name=guest_data["name"],
-                    personality=personality,
-                    background=background,
-                    voice_instruction=voice_instruction
+                    personality=guest_data["personality"],
+                    background=guest_data["background"]
                 )
             except (KeyError, ValueError):
                 pass
         
         # Fallback guest if generation fails
+        return self._fallback_guest(topic)
+    
+    def _fallback_guest(self, topic: Topic) -> Speaker:
+        """
+        Create the default guest used when no persona could be generated.
+        
+        Args:
+            topic: The podcast topic.
+            
+        Returns:
+            Speaker: The fallback guest speaker object.
+        """
         return Speaker(
             role=Role.GUEST,
-            voice=Config.GUEST_VOICE,
+            voice=Config.guest_voice(),
             name="Dr. Jamie Reynolds",
             personality="Articulate, thoughtful, and passionate about their field of expertise.",
             background=f"Leading researcher and author in the field of {topic.keywords[0] if topic.keywords else topic.title}",
             voice_instruction="Speak with authority and academic precision."
         )
     
-    def _generate_conversation_turns(self, topic: Topic, host: Speaker, guest: Speaker, num_turns: int = 10) -> List[DialogueTurn]:
+    async def _generate_conversation_turns(self, topic: Topic, host: Speaker, guest: Speaker, num_turns: int = 10) -> AsyncIterator[DialogueTurn]:
         """
         Generate the conversation between host and guest.
         
+        The completion is streamed and each turn is yielded as soon as its JSON
+        object is complete, so callers can start on a turn while the model is
+        still writing the rest of the conversation.
+        
         Args:
             topic: The podcast topic.
             host: The host speaker.
             guest: The guest speaker.
             num_turns: Number of conversation turns to generate.
             
-        Returns:
-            List[DialogueTurn]: List of dialogue turns in the conversation.
+        Yields:
+            DialogueTurn: The dialogue turns in conversation order.
         """
         # Adjust for the 3 outro turns we'll add later
         main_conversation_turns = max(3, num_turns - 3)
         
-        system_prompt = (
-            f"You are generating a podcast conversation between a host ({host.name}) and "
-            f"a guest expert ({guest.name}) on the topic: '{topic.title}'.\n\n"
-            f"Host personality: {host.personality}\n"
-            f"Host background: {host.background}\n\n"
-            f"Guest personality: {guest.personality}\n"
-            f"Guest background: {guest.background}\n\n"
-            "Generate a natural, engaging, and SUBSTANTIVE conversation with real content, not just an introduction and conclusion. "
-            "The host should ask thoughtful questions, and the guest should provide detailed expert insights. "
-            "The conversation must be intellectually stimulating and have significant depth and substance. "
-            "DO NOT generate generic or superficial content. Include specific details, examples, and nuanced perspectives."
-            "DO NOT include any wrap-up or conclusion - I will add those separately."
-        )
-        
-        user_prompt = (
-            f"Create a substantive intellectual podcast conversation on '{topic.title}' with EXACTLY {main_conversation_turns} turns. "
-            "The conversation MUST alternate between host and guest, starting with the host.\n\n"
-            "Essential requirements:\n"
-            f"1. A brief welcoming introduction from the host (first turn only)\n"
-            f"2. At least {main_conversation_turns-1} substantive exchanges with real intellectual content\n"
-            "3. Specific questions that explore different aspects of the topic in depth\n"
-            "4. Detailed, informative responses from the guest with examples and nuance\n"
-            "5. The conversation must progress logically with follow-up questions\n\n"
-            "Format your response as a JSON array with each element having exactly two fields: 'speaker' (either 'host' or 'guest') and 'text':\n\n"
-            "[\n"
-            "  {\n"
-            "    \"speaker\": \"host\",\n"
-            "    \"text\": \"Welcome to our podcast...\"\n"
-            "  },\n"
-            "  {\n"
-            "    \"speaker\": \"guest\",\n"
-            "    \"text\": \"Thank you for having me...\"\n"
-            "  },\n"
-            f"  // IMPORTANT: You must generate {main_conversation_turns-2} MORE turns with substantial content\n"
-            "]\n\n"
-            "DO NOT include any conclusion or wrap-up turns - those will be added separately.\n"
-            f"ENSURE exactly {main_conversation_turns} turns total."
+        user_prompt = _TURNS_USER_TEMPLATE.format(
+            title=topic.title,
+            host_name=host.name,
+            host_personality=host.personality,
+            host_background=host.background,
+            guest_name=guest.name,
+            guest_personality=guest.personality,
+            guest_background=guest.background,
+            turns=main_conversation_turns,
+            exchanges=main_conversation_turns - 1,
+            more_turns=main_conversation_turns - 2
         )
         
-        response = self.client.chat.completions.create(
+        stream = await self.client.create(
             model=Config.MODEL_NAME,
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _TURNS_SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt}
             ],
-            response_format={"type": "json_object"}
+            response_format=TURNS_RESPONSE_FORMAT,
+            stream=True
         )
         
-        content = response.choices[0].message.content
+        parser = _TurnStreamParser()
         turns: List[DialogueTurn] = []
         
-        if content:
-            try:
-                # Debug the received content
-                print(f"Debug - API response content: {content[:300]}...")
-                
-                # Parse JSON response
-                json_data = json.loads(content)
-                
-                # Handle different response formats
-                turns_data = None
-                if isinstance(json_data, list):
-                    turns_data = json_data
-                elif isinstance(json_data, dict) and any(k in json_data for k in ['conversation', 'turns', 'messages', 'dialogues']):
-                    for key in ['conversation', 'turns', 'messages', 'dialogues']:
-                        if key in json_data and isinstance(json_data[key], list):
-                            turns_data = json_data[key]
-                            print(f"Found turns in field: {key}")
-                            break
-                
-                # If we still don't have turns data, look for any list field
-                if turns_data is None and isinstance(json_data, dict):
-                    for key, value in json_data.items():
-                        if isinstance(value, list) and len(value) > 0:
-                            turns_data = value
-                            print(f"Using list field: {key}")
-                            break
-                
-                # Process turns if we found them
-                if turns_data and isinstance(turns_data, list):
-                    print(f"Processing {len(turns_data)} conversation turns")
-                    for i, turn_data in enumerate(turns_data):
-                        if isinstance(turn_data, dict):
-                            speaker_key = next((k for k in turn_data.keys() if k.lower() == 'speaker'), 'speaker')
-                            text_key = next((k for k in turn_data.keys() if k.lower() == 'text'), 'text')
-                            
-                            speaker_value = turn_data.get(speaker_key, "")
-                            text_value = turn_data.get(text_key, "")
-                            
-                            role = Role.HOST if str(speaker_value).lower() == "host" else Role.GUEST
-                            turns.append(DialogueTurn(speaker=role, text=str(text_value)))
-                        else:
-                            print(f"Warning: Turn {i} is not a dictionary: {turn_data}")
-                else:
-                    raise ValueError(f"No valid turns data found in response: {json_data}")
-                    
-                # Check if we have enough turns
-                expected_min_turns = max(5, main_conversation_turns - 2)  # Allow slight flexibility but ensure substance
-                if len(turns) < expected_min_turns:
-                    print(f"WARNING: Only {len(turns)} turns generated. Expected at least {expected_min_turns} (requested: {main_conversation_turns})")
-                    
-                    # If too few turns, add fallback conversation content
-                    if len(turns) <= 2:  # If only intro turns or less
-                        print("Critical: Generated conversation is too short - using fallback content")
-                        # Keep any existing turns (usually intro)
-                        existing_turns = turns.copy() if turns else []
-                        turns = [
-                            DialogueTurn(speaker=Role.HOST, text=f"Welcome to Pedantalk. Today we're discussing {topic.title}. I'm joined by {guest.name}, an expert in this field."),
-                            DialogueTurn(speaker=Role.GUEST, text=f"Thanks for having me, {host.name}. It's a pleasure to be here to talk about this fascinating topic.")
-                        ]
-                        
-                        # Only use existing turns if we have none yet (avoid duplication)
-                        if not existing_turns:
-                            turns = existing_turns
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            
+            for turn_data in parser.feed(delta):
+                try:
+                    turn = _TURN_ADAPTER.validate_python(turn_data)
+                except ValidationError as e:
+                    logger.warning("Skipping invalid turn %s: %s", turn_data, e)
+                    continue
+                turns.append(turn)
+                yield turn
+        
+        logger.debug("API response content: %.300s...", parser.text)
+        
+        for turn in self._finish_turns(topic, host, guest, turns, main_conversation_turns):
+            yield turn
+    
+    def build_episode_request(self, topic: Topic, num_turns: int = 10) -> Dict[str, Any]:
+        """
+        Build the single request for the guest persona, voice instruction and conversation.
+        
+        Args:
+            topic: The podcast topic.
+            num_turns: Number of conversation turns to generate (including the structured outro).
+            
+        Returns:
+            Dict[str, Any]: Arguments for chat.completions.create.
+        """
+        host = self._generate_host(topic)
+        
+        # Adjust for the 3 outro turns we'll add later
+        main_conversation_turns = max(3, num_turns - 3)
+        
+        user_prompt = _EPISODE_USER_TEMPLATE.format(
+            title=topic.title,
+            description=topic.description,
+            host_name=host.name,
+            host_personality=host.personality,
+            host_background=host.background,
+            turns=main_conversation_turns,
+            exchanges=main_conversation_turns - 1,
+            more_turns=main_conversation_turns - 2
+        )
+        
+        return {
+            "model": Config.MODEL_NAME,
+            "messages": [
+                {"role": "system", "content": _EPISODE_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            "response_format": EPISODE_RESPONSE_FORMAT
+        }
+    
+    async def _generate_episode_items(self, topic: Topic, host: Speaker, guest: Speaker, num_turns: int = 10) -> AsyncIterator[Union[Speaker, DialogueTurn]]:
+        """
+        Generate the guest persona, voice instruction and conversation in a single request.
+        
+        Args:
+            topic: The podcast topic.
+            host: The host speaker.
+            guest: The guest to use if the response does not contain a valid one.
+            num_turns: Number of conversation turns to generate.
+            
+        Yields:
+            Union[Speaker, DialogueTurn]: The generated guest, if any, followed by the
+                dialogue turns in conversation order.
+        """
+        stream = await self.client.create(**self.build_episode_request(topic, num_turns), stream=True)
+        
+        async def deltas() -> AsyncIterator[str]:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        
+        async for item in self._parse_episode_items(deltas(), topic, host, guest, num_turns):
+            yield item
+    
+    async def _parse_episode_items(self, deltas: AsyncIterator[str], topic: Topic, host: Speaker, guest: Speaker, num_turns: int) -> AsyncIterator[Union[Speaker, DialogueTurn]]:
+        """
+        Parse the response to the episode request as it arrives.
+        
+        Turns are held back until the generated guest has been yielded, so consumers
+        always synthesize them with the final guest voice instruction.
+        
+        Args:
+            deltas: The response content, in pieces.
+            topic: The podcast topic.
+            host: The host speaker.
+            guest: The guest to use if the response does not contain a valid one.
+            num_turns: Number of conversation turns requested.
+            
+        Yields:
+            Union[Speaker, DialogueTurn]: The generated guest, if any, followed by the
+                dialogue turns in conversation order.
+        """
+        main_conversation_turns = max(3, num_turns - 3)
+        parser = _TurnStreamParser()
+        turns: List[DialogueTurn] = []
+        guest_found = False
+        
+        async for delta in deltas:
+            for item_data in parser.feed(delta):
+                # The guest is the only object in the response without a speaker
+                if "speaker" not in item_data:
+                    if guest_found:
+                        continue
+                    try:
+                        persona = GuestPersona.model_validate(item_data)
+                    except ValidationError as e:
+                        logger.warning("Skipping invalid guest %s: %s", item_data, e)
+                        continue
                     
-                    # Add substantive Q&A content until we reach minimum length
-                    current_speaker = Role.HOST if turns[-1].speaker == Role.GUEST else Role.GUEST
-                    while len(turns) < expected_min_turns:
-                        if current_speaker == Role.HOST:
-                            turns.append(DialogueTurn(
-                                speaker=Role.HOST,
-                                text=f"One important aspect of {topic.title} that we haven't discussed yet is the broader implications. Could you elaborate on how this affects society at large?"
-                            ))
-                        else:
-                            turns.append(DialogueTurn(
-                                speaker=Role.GUEST,
-                                text=f"That's an excellent question. When we consider {topic.title}, we have to recognize that it impacts multiple domains of human experience. Research has shown several key patterns. First, there's the immediate effect on individuals and communities. Second, we see longer-term structural changes that reshape institutions. Finally, there are ethical considerations that we must address carefully."
-                            ))
-                        current_speaker = Role.HOST if current_speaker == Role.GUEST else Role.GUEST
+                    guest = Speaker(
+                        role=Role.GUEST,
+                        voice=Config.guest_voice(),
+                        name=persona.name,
+                        personality=persona.personality,
+                        background=persona.background,
+                        voice_instruction=persona.voice_instruction or "Speak with authority and clarity."
+                    )
+                    guest_found = True
+                    yield guest
+                    # Release the turns that arrived before the guest
+                    for turn in turns:
+                        yield turn
+                    continue
                 
-                # Print final turn count for debugging
-                print(f"Final conversation turn count: {len(turns)} (before adding outro)")
+                try:
+                    turn = _TURN_ADAPTER.validate_python(item_data)
+                except ValidationError as e:
+                    logger.warning("Skipping invalid turn %s: %s", item_data, e)
+                    continue
+                turns.append(turn)
+                if guest_found:
+                    yield turn
+        
+        logger.debug("API response content: %.300s...", parser.text)
+        
+        if not guest_found:
+            logger.warning("No guest found in response - using fallback guest")
+            for turn in turns:
+                yield turn
+        
+        for turn in self._finish_turns(topic, host, guest, turns, main_conversation_turns):
+            yield turn
+    
+    def _finish_turns(self, topic: Topic, host: Speaker, guest: Speaker, turns: List[DialogueTurn], main_conversation_turns: int) -> Iterator[DialogueTurn]:
+        """
+        Generate the turns that follow the model's turns: fallback content and the outro.
+        
+        Args:
+            topic: The podcast topic.
+            host: The host speaker.
+            guest: The guest speaker.
+            turns: The turns already generated by the model.
+            main_conversation_turns: Number of turns requested from the model.
+            
+        Yields:
+            DialogueTurn: The remaining dialogue turns in conversation order.
+        """
+        turn_count = len(turns)
+        last_speaker = turns[-1].speaker if turns else None
+        
+        if turn_count == 0:
+            logger.error("Error parsing conversation turns: no valid turns found in response")
+            # Fallback to default conversation
+            yield DialogueTurn(speaker=Role.HOST, text=f"Welcome to Pedantalk. Today we're discussing {topic.title}. I'm joined by {guest.name}, an expert in this field.")
+            yield DialogueTurn(speaker=Role.GUEST, text=f"Thanks for having me, {host.name}. It's a pleasure to be here to talk about this fascinating topic.")
+            turn_count = 2
+            last_speaker = Role.GUEST
+        
+        # Check if we have enough turns
+        expected_min_turns = max(5, main_conversation_turns - 2)  # Allow slight flexibility but ensure substance
+        if turn_count < expected_min_turns:
+            logger.warning(
+                "Only %d turns generated. Expected at least %d (requested: %d)",
+                turn_count, expected_min_turns, main_conversation_turns
+            )
             
-            except (KeyError, ValueError, AttributeError, json.JSONDecodeError) as e:
-                print(f"Error parsing conversation turns: {e}")
-                # Fallback to default conversation
-                turns = [
-                    DialogueTurn(speaker=Role.HOST, text=f"Welcome to Pedantalk. Today we're discussing {topic.title}. I'm joined by {guest.name}, an expert in this field."),
-                    DialogueTurn(speaker=Role.GUEST, text=f"Thanks for having me, {host.name}. It's a pleasure to be here to talk about this fascinating topic.")
-                ]
+            # Turns already streamed out cannot be replaced, so add substantive
+            # Q&A content until we reach minimum length, alternating speakers
+            roles = (Role.GUEST, Role.HOST)
+            texts = (
+                _FALLBACK_GUEST_TMPL.format(title=topic.title),
+                _FALLBACK_HOST_TMPL.format(title=topic.title)
+            )
+            i = 1 if last_speaker == Role.GUEST else 0
+            while turn_count < expected_min_turns:
+                yield DialogueTurn(speaker=roles[i & 1], text=texts[i & 1])
+                i += 1
+                turn_count += 1
+        
+        logger.debug("Final conversation turn count: %d (before adding outro)", turn_count)
         
         # Add structured outro (3 turns)
         # 1. Host wraps up and asks for final thoughts
-        turns.append(DialogueTurn(
+        yield DialogueTurn(
             speaker=Role.HOST,
             text=f"We're approaching the end of our time. {guest.name}, I'd like to thank you for this fascinating discussion on {topic.title}. Before we wrap up, what are your final thoughts on this topic?"
-        ))
+        )
         
         # 2. Guest shares final thoughts
-        turns.append(DialogueTurn(
+        yield DialogueTurn(
             speaker=Role.GUEST,
             text=f"Thank you for having me, {host.name}. To summarize my thoughts on {topic.title}, I believe it's a critically important area that will continue to evolve. I've enjoyed our conversation and hope your listeners found it insightful."
-        ))
+        )
         
         # 3. Host concludes the episode
-        turns.append(DialogueTurn(
+        yield DialogueTurn(
             speaker=Role.HOST,
             text=f"Thank you, {guest.name}, for sharing your expertise with us today. To our listeners, thank you for joining us for another episode of Pedantalk. Please join us next time for more thought-provoking discussions. Until then, keep questioning and stay curious."
-        ))
-        
-        return turns
+        )
     
-    def generate_conversation(self, topic: Topic, num_turns: int = 10) -> Conversation:
+    async def create_conversation(self, topic: Topic) -> Conversation:
         """
-        Generate a complete podcast conversation.
+        Create a conversation with its host and guest but no turns yet.
+        
+        Unless the generator is in legacy mode, the guest is a placeholder that
+        generate_turns replaces with the guest generated alongside the turns.
         
         Args:
             topic: The podcast topic.
-            num_turns: Number of conversation turns to generate (including the structured outro).
             
         Returns:
-            Conversation: The complete conversation object.
+            Conversation: The conversation, ready for generate_turns.
         """
         host = self._generate_host(topic)
-        guest = self._generate_guest(topic)
-        turns = self._generate_conversation_turns(topic, host, guest, num_turns)
+        guest = await self._generate_guest(topic) if self.legacy else self._fallback_guest(topic)
         
         return Conversation(
             topic=topic,
             host=host,
             guest=guest,
-            turns=turns
-        ) 
+            turns=[]
+        )
+    
+    async def generate_turns(self, conversation: Conversation, num_turns: int = 10, turn_queue: Optional["asyncio.Queue[Optional[DialogueTurn]]"] = None) -> None:
+        """
+        Generate the turns of a conversation, appending them as they stream in.
+        
+        Args:
+            conversation: The conversation created by create_conversation.
+            num_turns: Number of conversation turns to generate (including the structured outro).
+            turn_queue: Optional queue that receives each turn as soon as it is
+                generated, followed by None once the conversation is complete. None is
+                not sent if generation fails, so a truncated conversation is never
+                mistaken for a complete one; the consumer must then be cancelled.
+        """
+        if self.legacy:
+            await self._generate_turns_separately(conversation, num_turns, turn_queue)
+        else:
+            await self._generate_turns_in_one_request(conversation, num_turns, turn_queue)
+        
+        if turn_queue is not None:
+            turn_queue.put_nowait(None)
+    
+    async def _generate_turns_separately(self, conversation: Conversation, num_turns: int, turn_queue: Optional["asyncio.Queue[Optional[DialogueTurn]]"]) -> None:
+        """
+        Generate the guest voice instruction and the turns with separate requests.
+        
+        Args:
+            conversation: The conversation created by create_conversation.
+            num_turns: Number of conversation turns to generate (including the structured outro).
+            turn_queue: Optional queue that receives each turn as soon as it is generated.
+        """
+        guest = conversation.guest
+        
+        # The voice instruction only depends on the persona, so it is generated
+        # concurrently with the conversation instead of before it
+        voice_task: Optional["asyncio.Task[str]"] = None
+        if guest.voice_instruction is None:
+            voice_task = asyncio.create_task(
+                self._generate_guest_voice_instruction(guest.personality, guest.background)
+            )
+        
+        try:
+            async for turn in self._generate_conversation_turns(conversation.topic, conversation.host, guest, num_turns):
+                # The guest's TTS reads the instruction, so it must be set before
+                # the first turn is handed to the consumer
+                if voice_task is not None and guest.voice_instruction is None:
+                    guest.voice_instruction = await voice_task
+                
+                conversation.turns.append(turn)
+                if turn_queue is not None:
+                    turn_queue.put_nowait(turn)
+            
+            if voice_task is not None and guest.voice_instruction is None:
+                guest.voice_instruction = await voice_task
+        finally:
+            # No effect once the task has finished
+            if voice_task is not None:
+                voice_task.cancel()
+    
+    async def _generate_turns_in_one_request(self, conversation: Conversation, num_turns: int, turn_queue: Optional["asyncio.Queue[Optional[DialogueTurn]]"]) -> None:
+        """
+        Generate the guest and the turns with a single request, replacing the placeholder guest.
+        
+        Args:
+            conversation: A conversation whose guest is a placeholder.
+            num_turns: Number of conversation turns to generate (including the structured outro).
+            turn_queue: Optional queue that receives each turn as soon as it is generated.
+        """
+        items = self._generate_episode_items(conversation.topic, conversation.host, conversation.guest, num_turns)
+        await self._fill_conversation(conversation, items, turn_queue)
+    
+    async def _fill_conversation(self, conversation: Conversation, items: AsyncIterator[Union[Speaker, DialogueTurn]], turn_queue: Optional["asyncio.Queue[Optional[DialogueTurn]]"]) -> None:
+        """
+        Add generated episode items to a conversation.
+        
+        Args:
+            conversation: A conversation whose guest is a placeholder.
+            items: The generated guest and turns.
+            turn_queue: Optional queue that receives each turn as soon as it is added.
+        """
+        async for item in items:
+            if isinstance(item, Speaker):
+                conversation.guest = item
+                continue
+            
+            conversation.turns.append(item)
+            if turn_queue is not None:
+                turn_queue.put_nowait(item)
+    
+    async def conversation_from_content(self, topic: Topic, content: Optional[str], num_turns: int = 10) -> Conversation:
+        """
+        Build a conversation from a completed response to build_episode_request.
+        
+        Used for responses obtained outside of this generator, such as batch results.
+        
+        Args:
+            topic: The podcast topic the request was built for.
+            content: The completion content.
+            num_turns: Number of conversation turns the request was built for.
+            
+        Returns:
+            Conversation: The complete conversation object.
+        """
+        conversation = Conversation(
+            topic=topic,
+            host=self._generate_host(topic),
+            guest=self._fallback_guest(topic),
+            turns=[]
+        )
+        
+        async def deltas() -> AsyncIterator[str]:
+            if content:
+                yield content
+        
+        items = self._parse_episode_items(deltas(), topic, conversation.host, conversation.guest, num_turns)
+        await self._fill_conversation(conversation, items, None)
+        return conversation
+    
+    async def generate_conversation(self, topic: Topic, num_turns: int = 10, turn_queue: Optional["asyncio.Queue[Optional[DialogueTurn]]"] = None) -> Conversation:
+        """
+        Generate a complete podcast conversation.
+        
+        Args:
+            topic: The podcast topic.
+            num_turns: Number of conversation turns to generate (including the structured outro).
+            turn_queue: Optional queue that receives each turn as soon as it is generated,
+                as described for generate_turns.
+            
+        Returns:
+            Conversation: The complete conversation object.
+        """
+        conversation = await self.create_conversation(topic)
+        await self.generate_turns(conversation, num_turns, turn_queue)
+        return conversation
@@ -0,0 +1,203 @@
+import functools
+import hashlib
+import json
+import logging
+import math
+import os
+import sqlite3
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import orjson
+
+from pedantalk.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(model: str, messages: Sequence[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build the exact-match cache key for a chat completion request.
+    
+    Args:
+        model: The model name.
+        messages: The request messages.
+        options: The remaining request arguments, such as response_format or max_tokens.
+    
+    Returns:
+        str: A hex digest identifying the request.
+    """
+    payload = json.dumps(
+        {"model": model, "messages": list(messages), "options": options},
+        sort_keys=True
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=32).hexdigest()
+
+
+def _cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """
+    Compute the cosine similarity of two vectors.
+    
+    Args:
+        a: The first vector.
+        b: The second vector.
+    
+    Returns:
+        float: The similarity, or 0.0 if either vector is zero.
+    """
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class LLMCache:
+    """On-disk cache of chat completion contents with an optional similarity tier."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: Path of the SQLite database file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "namespace TEXT NOT NULL, vector TEXT NOT NULL, content TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        
+        # Vectors are loaded once per namespace; the tables are small enough to scan in memory
+        self._vectors: Dict[str, List[Tuple[List[float], str]]] = {}
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached completion.
+        
+        Args:
+            key: Key from cache_key.
+        
+        Returns:
+            Optional[str]: The cached content, or None on a miss.
+        """
+        row = self._conn.execute("SELECT content FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: str, content: str) -> None:
+        """
+        Store a completion.
+        
+        Args:
+            key: Key from cache_key.
+            content: The completion content.
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)", (key, content)
+        )
+        self._conn.commit()
+    
+    async def get_or_set(self, key: str, factory: Callable[[], Awaitable[Optional[str]]]) -> Optional[str]:
+        """
+        Return the cached completion, or create and store it on a miss.
+        
+        Args:
+            key: Key from cache_key.
+            factory: Coroutine function that performs the request and returns its content.
+        
+        Returns:
+            Optional[str]: The completion content. Empty results are returned but not stored.
+        """
+        content = self.get(key)
+        if content is not None:
+            logger.debug("LLM cache hit: %s", key)
+            return content
+        
+        content = await factory()
+        if content:
+            self.set(key, content)
+        return content
+    
+    def _load_vectors(self, namespace: str) -> List[Tuple[List[float], str]]:
+        """
+        Get the stored vectors of a namespace, loading them on first use.
+        
+        Args:
+            namespace: The similarity namespace.
+        
+        Returns:
+            List[Tuple[List[float], str]]: The (vector, content) pairs.
+        """
+        vectors = self._vectors.get(namespace)
+        if vectors is None:
+            rows = self._conn.execute(
+                "SELECT vector, content FROM embeddings WHERE namespace = ?", (namespace,)
+            ).fetchall()
+            vectors = [(orjson.loads(vector), content) for vector, content in rows]
+            self._vectors[namespace] = vectors
+        return vectors
+    
+    def find_similar(self, namespace: str, vector: Sequence[float], threshold: float) -> Optional[str]:
+        """
+        Find the content stored with the most similar vector.
+        
+        Args:
+            namespace: The similarity namespace.
+            vector: Embedding of the new input.
+            threshold: Minimum cosine similarity for a hit.
+        
+        Returns:
+            Optional[str]: The best matching content, or None if nothing reaches the threshold.
+        """
+        best_score = threshold
+        best_content: Optional[str] = None
+        for stored, content in self._load_vectors(namespace):
+            score = _cosine_similarity(vector, stored)
+            if score >= best_score:
+                best_score = score
+                best_content = content
+        
+        if best_content is not None:
+            logger.debug("LLM semantic cache hit in %s (similarity %.3f)", namespace, best_score)
+        return best_content
+    
+    def add_similar(self, namespace: str, vector: Sequence[float], content: str) -> None:
+        """
+        Store content for future similarity lookups.
+        
+        Args:
+            namespace: The similarity namespace.
+            vector: Embedding of the input that produced the content.
+            content: The completion content.
+        """
+        vectors = self._load_vectors(namespace)
+        self._conn.execute(
+            "INSERT INTO embeddings (namespace, vector, content) VALUES (?, ?, ?)",
+            (namespace, json.dumps(list(vector)), content)
+        )
+        self._conn.commit()
+        vectors.append((list(vector), content))
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm_cache() -> Optional[LLMCache]:
+    """
+    Get the shared response cache.
+    
+    Returns:
+        Optional[LLMCache]: The cache at Config.LLM_CACHE_PATH, or None if caching is disabled
+            or the database cannot be opened.
+    """
+    if not Config.LLM_CACHE_PATH:
+        return None
+    
+    try:
+        return LLMCache(Config.LLM_CACHE_PATH)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("LLM cache disabled, cannot open %s: %s", Config.LLM_CACHE_PATH, e)
+        return None
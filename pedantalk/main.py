@@ -1,28 +1,48 @@
 import argparse
+import asyncio
+import atexit
+import contextlib
 import datetime
+import itertools
 import logging
+import logging.handlers
 import os
-from typing import Optional
-
-from openai import OpenAI
+import queue
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from pedantalk.audio_processor import AudioProcessor
+from pedantalk.batch_runner import BatchRunner
 from pedantalk.config import Config
 from pedantalk.conversation_generator import ConversationGenerator
-from pedantalk.models import Conversation, Role, Topic
+from pedantalk.models import Conversation, DialogueTurn, PodcastEpisode, Role, Topic
+from pedantalk.openai_client import close_openai_client
 from pedantalk.topic_generator import TopicGenerator
 
 
 def setup_logging() -> None:
-    """Set up logging configuration."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler(os.path.join(Config.OUTPUT_DIR, "pedantalk.log"))
-        ]
-    )
+    """
+    Set up logging configuration.
+    
+    Records are handed to a queue and written to the console and log file by a
+    background listener thread, so logging never blocks the event loop on I/O.
+    """
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers: List[logging.Handler] = [
+        logging.StreamHandler(),
+        logging.FileHandler(os.path.join(Config.OUTPUT_DIR, "pedantalk.log"))
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Flush the remaining records on exit
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
 
 def parse_args() -> argparse.Namespace:
@@ -50,6 +70,22 @@ def parse_args() -> argparse.Namespace:
         type=str,
         help="Instruction for the host's voice (e.g., 'Speak with a calm, engaging tone')"
     )
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="Generate the guest, its voice instruction and the conversation with separate requests"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Generate text through the OpenAI Batch API (cheaper, but may take up to 24 hours)"
+    )
+    parser.add_argument(
+        "--episodes",
+        type=int,
+        default=1,
+        help="Number of episodes to generate in --batch mode (default: 1)"
+    )
     return parser.parse_args()
 
 
@@ -94,6 +130,21 @@ def main() -> None:
         Config.HOST_VOICE_INSTRUCTION = args.host_voice_instruction
         logger.info(f"Using custom host voice instruction: {Config.HOST_VOICE_INSTRUCTION}")
     
+    if args.episodes != 1 and not args.batch:
+        logger.error("--episodes requires --batch")
+        return
+    
+    if args.legacy and args.batch:
+        logger.error("--legacy cannot be combined with --batch")
+        return
+    
+    if args.episodes < 1:
+        logger.error("--episodes must be at least 1")
+        return
+    
+    if Config.SEMANTIC_CACHE and not args.legacy:
+        logger.info("SEMANTIC_CACHE only applies to --legacy runs and is ignored")
+    
     # Validate configuration
     error = Config.validate()
     if error:
@@ -102,59 +153,185 @@ def main() -> None:
     
     logger.info("Starting pedantalk podcast generation")
     logger.info(f"Using host voice: {Config.HOST_VOICE}")
-    logger.info(f"Using guest voice: {Config.GUEST_VOICE}")
-    
-    # Initialize the OpenAI client
-    client = OpenAI(api_key=Config.OPENAI_API_KEY)
-    
-    # Generate or use provided topic
-    if args.topic:
-        logger.info(f"Using provided topic: {args.topic}")
-        topic = create_topic_from_string(args.topic)
-    else:
-        logger.info("Generating random topic")
-        topic_generator = TopicGenerator()
-        topic = topic_generator.generate_topic()
-        logger.info(f"Generated topic: {topic.title}")
-    
-    # Generate conversation
-    logger.info("Generating conversation")
-    conversation_generator = ConversationGenerator()
-    conversation = conversation_generator.generate_conversation(topic, args.turns)
+    logger.info(f"Using guest voice: {Config.guest_voice()}")
+    
+    asyncio.run(generate_batch(args) if args.batch else generate_podcast(args))
+
+
+async def generate_podcast(args: argparse.Namespace) -> None:
+    """
+    Generate a podcast episode and its transcript.
+    
+    Args:
+        args: Parsed command line arguments.
+    """
+    logger = logging.getLogger(__name__)
+    
+    audio_processor: Optional[AudioProcessor] = None
+    warm_up_task: Optional[asyncio.Task[None]] = None
+    conversation_task: Optional[asyncio.Task[None]] = None
+    audio_task: Optional[asyncio.Task[PodcastEpisode]] = None
+    
+    try:
+        # Open the TTS connection while the topic and conversation are being generated
+        audio_processor = AudioProcessor()
+        warm_up_task = asyncio.create_task(audio_processor.warm_up())
+        
+        # Generate or use provided topic
+        if args.topic:
+            logger.info(f"Using provided topic: {args.topic}")
+            topic = create_topic_from_string(args.topic)
+        else:
+            logger.info("Generating random topic")
+            topic_generator = TopicGenerator()
+            topic = await topic_generator.generate_topic()
+            logger.info(f"Generated topic: {topic.title}")
+        
+        # Generate conversation
+        logger.info("Generating conversation")
+        conversation_generator = ConversationGenerator(legacy=args.legacy)
+        conversation = await conversation_generator.create_conversation(topic)
+        
+        # Stream the turns into the audio stage so TTS starts while the rest
+        # of the conversation is still being generated
+        turn_queue: asyncio.Queue[Optional[DialogueTurn]] = asyncio.Queue()
+        conversation_task = asyncio.create_task(
+            conversation_generator.generate_turns(conversation, args.turns, turn_queue)
+        )
+        
+        # Generate audio, writing the transcript from the same stream of turns
+        logger.info("Generating audio")
+        episode_id = generate_episode_id()
+        await warm_up_task
+        with open_transcript(episode_id, conversation) as (transcript_path, write_turn):
+            audio_task = asyncio.create_task(
+                audio_processor.generate_podcast_audio(conversation, episode_id, turn_queue, on_turn=write_turn)
+            )
+            # A failed conversation never ends the turn stream, so stop at the first failure
+            # of either stage rather than finalizing a truncated episode
+            done, _ = await asyncio.wait((conversation_task, audio_task), return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+            episode = audio_task.result()
+    finally:
+        tasks = [task for task in (warm_up_task, conversation_task, audio_task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        # Let the stages clean up before their scratch files and client go away
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if audio_processor is not None:
+            audio_processor.close()
+        await close_openai_client()
     
     # Log detailed info about conversation
     logger.info(f"Generated conversation with {len(conversation.turns)} turns (requested: {args.turns})")
     logger.info(f"Host: {conversation.host.name}, Guest: {conversation.guest.name}")
     
-    # Print conversation sequence for debugging
-    print("\nDEBUG - CONVERSATION SEQUENCE:")
-    for i, turn in enumerate(conversation.turns):
-        speaker_name = conversation.host.name if turn.speaker == Role.HOST else conversation.guest.name
-        print(f"{i+1}. {speaker_name}: {turn.text[:50]}..." if len(turn.text) > 50 else f"{i+1}. {speaker_name}: {turn.text}")
-    print()
-    
-    # Generate audio
-    logger.info("Generating audio")
-    episode_id = generate_episode_id()
-    audio_processor = AudioProcessor(client)
-    episode = audio_processor.generate_podcast_audio(conversation, episode_id)
-    
     # Output results
     logger.info(f"Podcast episode generated: {episode.final_audio_path}")
     logger.info(f"Total duration: {episode.metadata.get('duration', 'unknown')} seconds")
+    logger.info(f"Transcript saved to: {transcript_path}")
+
+
+async def generate_batch(args: argparse.Namespace) -> None:
+    """
+    Generate podcast episodes with their text requests submitted through the Batch API.
     
-    # Save transcript
-    transcript_path = os.path.join(Config.TRANSCRIPT_DIR, f"{episode_id}_transcript.txt")
-    with open(transcript_path, "w") as f:
-        f.write(f"Title: {topic.title}\n")
-        f.write(f"Host: {conversation.host.name}\n")
-        f.write(f"Guest: {conversation.guest.name}\n\n")
+    Args:
+        args: Parsed command line arguments.
+    """
+    logger = logging.getLogger(__name__)
+    audio_processor: Optional[AudioProcessor] = None
+    try:
+        batch_runner = BatchRunner()
+        
+        # Generate or use provided topics
+        if args.topic:
+            logger.info(f"Using provided topic: {args.topic}")
+            topics = [create_topic_from_string(args.topic)] * args.episodes
+        else:
+            logger.info(f"Submitting {args.episodes} topic requests as a batch")
+            topic_generator = TopicGenerator()
+            topic_requests = {f"topic-{i}": topic_generator.build_request() for i in range(args.episodes)}
+            topic_results = await batch_runner.run(topic_requests, "topics")
+            topics = [topic_generator.parse_topic(topic_results[f"topic-{i}"]) for i in range(args.episodes)]
         
-        for turn in conversation.turns:
-            speaker_name = conversation.host.name if turn.speaker == "host" else conversation.guest.name
-            f.write(f"{speaker_name}: {turn.text}\n\n")
+        # Generate the guests and conversations
+        logger.info(f"Submitting {len(topics)} conversation requests as a batch")
+        conversation_generator = ConversationGenerator()
+        episode_requests = {
+            f"episode-{i}": conversation_generator.build_episode_request(topic, args.turns)
+            for i, topic in enumerate(topics)
+        }
+        episode_results = await batch_runner.run(episode_requests, "episodes")
+        
+        # Generate audio
+        batch_id = generate_episode_id()
+        audio_processor = AudioProcessor()
+        for i, topic in enumerate(topics):
+            conversation = await conversation_generator.conversation_from_content(
+                topic, episode_results[f"episode-{i}"], args.turns
+            )
+            logger.info(f"Generating audio for episode {i + 1} of {len(topics)}: {topic.title}")
+            episode_id = f"{batch_id}_{i + 1:02d}"
+            with open_transcript(episode_id, conversation) as (transcript_path, write_turn):
+                episode = await audio_processor.generate_podcast_audio(
+                    conversation, episode_id, on_turn=write_turn
+                )
+            logger.info(f"Podcast episode generated: {episode.final_audio_path}")
+            logger.info(f"Transcript saved to: {transcript_path}")
+    finally:
+        if audio_processor is not None:
+            audio_processor.close()
+        await close_openai_client()
+
+
+@contextlib.contextmanager
+def open_transcript(episode_id: str, conversation: Conversation) -> Iterator[Tuple[str, Callable[[DialogueTurn], None]]]:
+    """
+    Open the transcript of an episode for writing turns as they arrive.
     
-    logger.info(f"Transcript saved to: {transcript_path}")
+    Each turn passed to the callback is appended to the file and logged at debug
+    level, so the transcript is written while the audio is being generated. The
+    file is removed if the block raises.
+    
+    Args:
+        episode_id: Unique identifier for the episode.
+        conversation: The episode's conversation.
+        
+    Yields:
+        Tuple[str, Callable[[DialogueTurn], None]]: Path of the transcript file and the
+            callback that appends a turn to it.
+    """
+    logger = logging.getLogger(__name__)
+    transcript_path = os.path.join(Config.TRANSCRIPT_DIR, f"{episode_id}_transcript.txt")
+    name_by_role: Dict[Role, str] = {}
+    turn_numbers = itertools.count(1)
+    
+    try:
+        with open(transcript_path, "w", encoding="utf-8") as f:
+            def write_turn(turn: DialogueTurn) -> None:
+                if not name_by_role:
+                    # The guest generated with the conversation is known once the first turn arrives
+                    name_by_role[Role.HOST] = conversation.host.name
+                    name_by_role[Role.GUEST] = conversation.guest.name
+                    f.write(
+                        f"Title: {conversation.topic.title}\n"
+                        f"Host: {name_by_role[Role.HOST]}\n"
+                        f"Guest: {name_by_role[Role.GUEST]}\n\n"
+                    )
+                
+                speaker_name = name_by_role[turn.speaker]
+                f.write(f"{speaker_name}: {turn.text}\n\n")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%d. %s: %s", next(turn_numbers), speaker_name, f"{turn.text[:50]}..." if len(turn.text) > 50 else turn.text)
+            
+            yield transcript_path, write_turn
+    except BaseException:
+        # The episode failed, so do not leave a transcript of part of it
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(transcript_path)
+        raise
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Role(str, Enum):
@@ -9,7 +10,10 @@ class Role(str, Enum):
     GUEST = "guest"
 
 
-class Speaker(BaseModel):
+# Records built in code or from validated responses are plain slotted dataclasses;
+# pydantic models are kept for API response shapes and serialized containers
+@dataclass(slots=True)
+class Speaker:
     role: Role
     voice: str
     name: str
@@ -18,17 +22,43 @@ class Speaker(BaseModel):
     voice_instruction: Optional[str] = None
 
 
-class Topic(BaseModel):
+@dataclass(slots=True)
+class Topic:
     title: str
     description: str
-    keywords: List[str] = Field(default_factory=list)
+    keywords: List[str] = field(default_factory=list)
 
 
-class DialogueTurn(BaseModel):
+@dataclass(slots=True)
+class DialogueTurn:
+    __pydantic_config__ = ConfigDict(extra="forbid")
+
     speaker: Role
     text: str
 
 
+class GuestPersona(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+    personality: str
+    background: str
+    voice_instruction: str
+
+
+class TurnsResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    turns: List[DialogueTurn]
+
+
+class EpisodeResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    guest: GuestPersona
+    turns: List[DialogueTurn]
+
+
 class Conversation(BaseModel):
     topic: Topic
     host: Speaker
@@ -36,7 +66,8 @@ class Conversation(BaseModel):
     turns: List[DialogueTurn] = Field(default_factory=list)
 
 
-class AudioSegment(BaseModel):
+@dataclass(slots=True)
+class AudioSegment:
     speaker: Role
     text: str
     audio_path: str
@@ -0,0 +1,146 @@
+import asyncio
+import functools
+import logging
+import random
+from typing import Any, Awaitable, Callable, Literal, TypeVar, Union, overload
+
+import httpx
+import openai
+from openai import AsyncOpenAI, AsyncStream
+from openai.types import CreateEmbeddingResponse
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+from pedantalk.config import Config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Exponential backoff bounds for retried requests, in seconds
+RETRY_MIN_WAIT = 1.0
+RETRY_MAX_WAIT = 30.0
+
+# Errors worth retrying: rate limits, 5xx responses, timeouts and dropped connections
+TRANSIENT_ERRORS = (
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+    openai.RateLimitError
+)
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """
+    Create the long-lived HTTP client shared by all OpenAI requests.
+    
+    Returns:
+        httpx.AsyncClient: An HTTP/2 client with a keep-alive pool sized for concurrent TTS.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=32)
+    )
+
+
+class ConcurrentOpenAI:
+    """AsyncOpenAI wrapper that bounds concurrent requests and retries transient failures."""
+
+    def __init__(self, client: AsyncOpenAI, max_concurrent_requests: int, max_retries: int) -> None:
+        """
+        Initialize the wrapper.
+        
+        Args:
+            client: The underlying OpenAI client.
+            max_concurrent_requests: Maximum number of requests in flight at once.
+            max_retries: Maximum number of retries after a transient error.
+        """
+        self.client = client
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._max_retries = max_retries
+    
+    async def _call(self, func: Callable[..., Awaitable[T]], **kwargs: Any) -> T:
+        """
+        Call an API method within the concurrency limit, backing off on transient errors.
+        
+        Args:
+            func: The client method to call.
+            **kwargs: Arguments for the method.
+        
+        Returns:
+            T: The method's result.
+        """
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                try:
+                    return await func(**kwargs)
+                except TRANSIENT_ERRORS as e:
+                    if attempt >= self._max_retries:
+                        raise
+                    delay = min(RETRY_MAX_WAIT, RETRY_MIN_WAIT * 2 ** attempt) * random.uniform(0.5, 1.0)
+                    logger.warning(
+                        "%s, retrying in %.1f s (retry %d of %d): %s",
+                        type(e).__name__, delay, attempt + 1, self._max_retries, e
+                    )
+            
+            # Back off outside the semaphore so other requests can use the slot
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    @overload
+    async def create(self, *, stream: Literal[True], **kwargs: Any) -> AsyncStream[ChatCompletionChunk]:
+        ...
+    
+    @overload
+    async def create(self, *, stream: Literal[False] = ..., **kwargs: Any) -> ChatCompletion:
+        ...
+    
+    async def create(self, **kwargs: Any) -> Union[ChatCompletion, AsyncStream[ChatCompletionChunk]]:
+        """
+        Create a chat completion.
+        
+        Args:
+            **kwargs: Arguments for chat.completions.create.
+        
+        Returns:
+            Union[ChatCompletion, AsyncStream[ChatCompletionChunk]]: The completion, or a
+                stream of chunks when stream=True.
+        """
+        result: Union[ChatCompletion, AsyncStream[ChatCompletionChunk]] = await self._call(
+            self.client.chat.completions.create, **kwargs
+        )
+        return result
+    
+    async def create_embedding(self, **kwargs: Any) -> CreateEmbeddingResponse:
+        """
+        Create an embedding.
+        
+        Args:
+            **kwargs: Arguments for embeddings.create.
+        
+        Returns:
+            CreateEmbeddingResponse: The embedding response.
+        """
+        return await self._call(self.client.embeddings.create, **kwargs)
+
+
+@functools.lru_cache(maxsize=1)
+def get_openai_client() -> ConcurrentOpenAI:
+    """
+    Get the shared OpenAI client, creating it on first use.
+    
+    Returns:
+        ConcurrentOpenAI: The client shared by the generators and the audio processor.
+    """
+    # One connection pool for every request so TLS setup is paid once per run;
+    # retries are handled by the wrapper so they respect the concurrency limit
+    client = AsyncOpenAI(api_key=Config.OPENAI_API_KEY, http_client=_create_http_client(), max_retries=0)
+    return ConcurrentOpenAI(client, Config.MAX_CONCURRENT_REQUESTS, Config.MAX_RETRIES)
+
+
+async def close_openai_client() -> None:
+    """Close the shared client's connection pool, if the client has been created."""
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().client.close()
+        get_openai_client.cache_clear()
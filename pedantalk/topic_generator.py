@@ -1,11 +1,28 @@
-from typing import List
-import json
+from typing import Any, Dict, List, Optional
 
 import openai
-from openai import OpenAI
+import orjson
 
 from pedantalk.config import Config
 from pedantalk.models import Topic
+from pedantalk.openai_client import get_openai_client
+
+
+# The topic request has no per-call values, so its prompts are built once
+_TOPIC_SYSTEM_PROMPT = (
+    "You are a podcast topic generator. Generate an interesting topic for "
+    "an intellectual discussion podcast. The topic should be thought-provoking "
+    "and suitable for a 20-30 minute conversation between a curious host and "
+    "an expert guest."
+)
+_TOPIC_USER_PROMPT = (
+    "Generate a podcast topic with the following JSON structure:\n"
+    "{\n"
+    "  \"title\": \"Topic title\",\n"
+    "  \"description\": \"A paragraph describing the topic\",\n"
+    "  \"keywords\": [\"keyword1\", \"keyword2\", \"keyword3\"]\n"
+    "}"
+)
 
 
 class TopicGenerator:
@@ -13,45 +30,36 @@ class TopicGenerator:
     
     def __init__(self) -> None:
         """Initialize the topic generator with OpenAI client."""
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+        self.client = get_openai_client()
     
-    def generate_topic(self) -> Topic:
+    def build_request(self) -> Dict[str, Any]:
         """
-        Generate a random podcast topic.
+        Build the chat completion request for a random topic.
         
         Returns:
-            Topic: A generated topic with title, description and keywords.
+            Dict[str, Any]: Arguments for chat.completions.create.
         """
-        response = self.client.chat.completions.create(
-            model=Config.MODEL_NAME,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a podcast topic generator. Generate an interesting topic for "
-                        "an intellectual discussion podcast. The topic should be thought-provoking "
-                        "and suitable for a 20-30 minute conversation between a curious host and "
-                        "an expert guest."
-                    )
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        "Generate a podcast topic with the following JSON structure:\n"
-                        "{\n"
-                        "  \"title\": \"Topic title\",\n"
-                        "  \"description\": \"A paragraph describing the topic\",\n"
-                        "  \"keywords\": [\"keyword1\", \"keyword2\", \"keyword3\"]\n"
-                        "}"
-                    )
-                }
+        return {
+            "model": Config.MODEL_NAME,
+            "messages": [
+                {"role": "system", "content": _TOPIC_SYSTEM_PROMPT},
+                {"role": "user", "content": _TOPIC_USER_PROMPT}
             ],
-            response_format={"type": "json_object"}
-        )
+            "response_format": {"type": "json_object"}
+        }
+    
+    def parse_topic(self, content: Optional[str]) -> Topic:
+        """
+        Parse the response to the topic request.
         
-        content = response.choices[0].message.content
+        Args:
+            content: The completion content.
+            
+        Returns:
+            Topic: The parsed topic, or a fallback topic if there is no content.
+        """
         if content:
-            topic_dict = json.loads(content)
+            topic_dict = orjson.loads(content)
             return Topic(
                 title=topic_dict["title"],
                 description=topic_dict["description"],
@@ -63,4 +71,14 @@ class TopicGenerator:
             title="The Future of Artificial Intelligence",
             description="Exploring the ethical implications and potential developments of AI in the next decade.",
             keywords=["AI ethics", "future technology", "machine learning"]
-        ) 
+        )
+    
+    async def generate_topic(self) -> Topic:
+        """
+        Generate a random podcast topic.
+        
+        Returns:
+            Topic: A generated topic with title, description and keywords.
+        """
+        response = await self.client.create(**self.build_request())
+        return self.parse_topic(response.choices[0].message.content)